@@ -1,8 +1,16 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+from dataclasses import dataclass, fields
+import datetime
+import hashlib
+import json
 import os
 import re
+import sys
+import time
 from pathlib import Path
-from typing import Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import yaml
 from dbt.contracts.graph.node_args import ModelNodeArgs
@@ -11,6 +19,7 @@ from dbt.contracts.graph.nodes import ModelNode
 from dbt.plugins.manager import dbt_hook, dbtPlugin
 from dbt.plugins.manifest import PluginNodes
 from dbt.config.project import VarProvider
+from dbt.flags import get_flags
 
 from dbt_loom.shims import is_invalid_private_ref, is_invalid_protected_ref
 
@@ -20,45 +29,99 @@ except ModuleNotFoundError:
     from dbt.node_types import NodeType  # type: ignore
 
 
-from dbt_loom.config import dbtLoomConfig
+from dbt_loom.cache import ManifestCache
+from dbt_loom.config import ManifestReference, dbtLoomConfig
+from dbt_loom.delta import DeltaStore, partition_nodes
+from dbt_loom.filters import NodeFilter
 from dbt_loom.logging import fire_event
-from dbt_loom.manifests import ManifestLoader, ManifestNode
+from dbt_loom.manifests import (
+    ManifestLoader,
+    ManifestNode,
+    identify_relation_identifier,
+)
+from dbt_loom.references import find_cross_project_refs, project_paths
+from dbt_loom.sessions import create_session
+from dbt_loom.snapshots import Snapshot, SnapshotStore
+from dbt_loom.timings import TimingRecorder, timed_phase, write_timings
 
 import importlib.metadata
 
 
+# The generation time used for nodes from manifests without one in their metadata.
+DEFAULT_GENERATED_AT = datetime.datetime(1970, 1, 1)
+
+# Properties that many injected nodes share, like package and schema names. These
+# are interned so that each distinct value is stored once, instead of once per node.
+INTERNED_FIELDS = (
+    "resource_type",
+    "package_name",
+    "database",
+    "schema",
+    "access",
+    "group",
+    "latest_version",
+    "event_time",
+)
+
+
+def intern_string(value: Any) -> Any:
+    """Intern a value if it is a plain string."""
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class LoomModelNodeArgs(ModelNodeArgs):
-    """A dbt-loom extension of ModelNodeArgs to preserve resource types across lineages."""
+    """
+    A dbt-loom extension of ModelNodeArgs to preserve resource types across lineages.
+    Only the properties used by dbt-loom are kept from the node's config, and
+    shared strings are interned to keep large numbers of injected nodes compact.
+    """
 
     resource_type: NodeType = NodeType.Model
     group: Optional[str] = None
     event_time: Optional[str] = None
 
-    def __init__(self, **kwargs):
-        super().__init__(
-            **{
-                key: value
-                for key, value in kwargs.items()
-                if key not in ("resource_type", "group", "config")
-            }
+    def __init__(
+        self,
+        resource_type: NodeType = NodeType.Model,
+        group: Optional[str] = None,
+        event_time: Optional[str] = None,
+        config: Optional[Dict] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.resource_type = resource_type
+        self.group = group
+        self.event_time = (
+            event_time if event_time is not None else (config or {}).get("event_time")
         )
-        self.resource_type = kwargs.get("resource_type", NodeType.Model)
-        self.group = kwargs.get("group")
-        self.event_time = kwargs.get("config", {}).get("event_time", None)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Share the strings of this node that are likely to repeat across nodes."""
+        for field in INTERNED_FIELDS:
+            setattr(self, field, intern_string(getattr(self, field)))
+        self.depends_on_nodes = [
+            intern_string(node_id) for node_id in self.depends_on_nodes
+        ]
+        # Most relations are named after their node, so share the name's string.
+        if self.identifier == self.name:
+            self.identifier = self.name
 
     @property
     def unique_id(self) -> str:
         unique_id = f"{self.resource_type}.{self.package_name}.{self.name}"
         if self.version:
             unique_id = f"{unique_id}.v{self.version}"
-
         return unique_id
 
 
-def identify_node_subgraph(manifest) -> Dict[str, ManifestNode]:
+def identify_node_subgraph(
+    manifest, node_filter: Optional[NodeFilter] = None
+) -> Dict[str, ManifestNode]:
     """
     Identify all nodes that should be selected from the manifest, and return ManifestNodes.
+    If a NodeFilter is provided, nodes are filtered before they are validated.
     """
 
     output = {}
@@ -73,6 +136,9 @@ def identify_node_subgraph(manifest) -> Dict[str, ManifestNode]:
         if not node:
             continue
 
+        if node_filter is not None and not node_filter(unique_id, node):
+            continue
+
         if node.get("access") is None:
             node["access"] = node.get("config", {}).get("access", "protected")
 
@@ -88,12 +154,18 @@ def identify_node_subgraph(manifest) -> Dict[str, ManifestNode]:
 
 def convert_model_nodes_to_model_node_args(
     selected_nodes: Dict[str, ManifestNode],
+    generated_at: datetime.datetime = DEFAULT_GENERATED_AT,
 ) -> Dict[str, LoomModelNodeArgs]:
-    """Generate a dictionary of ModelNodeArgs based on a dictionary of ModelNodes"""
+    """
+    Generate a dictionary of ModelNodeArgs based on a dictionary of ModelNodes.
+    Every node is marked as generated at `generated_at`, usually the generation
+    time of its manifest, so that conversions of the same nodes are identical.
+    """
     return {
         unique_id: LoomModelNodeArgs(
             schema=node.schema_name,
             identifier=node.identifier,
+            generated_at=generated_at,
             **(node.dump()),
         )
         for unique_id, node in selected_nodes.items()
@@ -101,6 +173,137 @@ def convert_model_nodes_to_model_node_args(
     }
 
 
+def prune_model_node_args(
+    nodes: Dict[str, LoomModelNodeArgs],
+    referenced_nodes: Set[Tuple[str, str]],
+    unpruned_packages: FrozenSet[str] = frozenset(),
+) -> Dict[str, LoomModelNodeArgs]:
+    """
+    Keep only the nodes referenced by `(package_name, name)` pairs, along with every
+    node in `unpruned_packages`. Every version of a referenced model is kept, so that
+    dbt can still resolve unpinned refs to the latest version.
+    """
+    return {
+        unique_id: node
+        for unique_id, node in nodes.items()
+        if node.package_name in unpruned_packages
+        or (node.package_name, node.name) in referenced_nodes
+    }
+
+
+def parse_datetime(value: Union[str, datetime.datetime, None]):
+    """Parse an ISO-8601 datetime from a manifest, as pydantic would."""
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def manifest_generated_at(metadata: Dict) -> datetime.datetime:
+    """
+    Get the time at which a manifest was generated, as a naive UTC datetime like
+    dbt's own. Injected nodes use this time instead of the current time, so that
+    nodes from an unchanged manifest are identical between invocations.
+    """
+    try:
+        generated_at = parse_datetime(metadata.get("generated_at"))
+    except (TypeError, ValueError):
+        generated_at = None
+
+    if generated_at is None:
+        return DEFAULT_GENERATED_AT
+
+    if generated_at.tzinfo is not None:
+        generated_at = generated_at.astimezone(datetime.timezone.utc).replace(
+            tzinfo=None
+        )
+    return generated_at
+
+
+def fingerprint_model_node_args(nodes: Dict[str, LoomModelNodeArgs]) -> str:
+    """
+    Generate a stable SHA-256 fingerprint of a set of injected nodes. The
+    fingerprint covers every field of every node, and does not depend on the
+    order of the nodes.
+    """
+    digest = hashlib.sha256()
+    for unique_id in sorted(nodes):
+        node = nodes[unique_id]
+        digest.update(
+            json.dumps(
+                [unique_id] + [getattr(node, field.name) for field in fields(node)],
+                default=str,
+            ).encode("utf-8")
+        )
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def convert_raw_nodes_to_model_node_args(
+    manifest: Dict,
+    node_filter: Optional[NodeFilter] = None,
+    generated_at: datetime.datetime = DEFAULT_GENERATED_AT,
+) -> Dict[str, LoomModelNodeArgs]:
+    """
+    Generate a dictionary of ModelNodeArgs directly from the raw nodes in a trusted
+    manifest. This skips ManifestNode validation entirely, and must produce the
+    same output as `identify_node_subgraph` and `convert_model_nodes_to_model_node_args`.
+    """
+
+    output = {}
+
+    for unique_id, node in manifest["nodes"].items():
+        resource_type = unique_id.split(".")[0]
+        if resource_type in (NodeType.Test.value, NodeType.Macro.value) or not node:
+            continue
+
+        if node_filter is not None and not node_filter(unique_id, node):
+            continue
+
+        config = node.get("config") or {}
+        version = node.get("version")
+        latest_version = node.get("latest_version")
+        depends_on = node.get("depends_on") or {}
+
+        output[unique_id] = LoomModelNodeArgs(
+            resource_type=resource_type,  # type: ignore
+            group=node.get("group"),
+            event_time=config.get("event_time"),
+            name=node["name"],
+            package_name=node["package_name"],
+            identifier=identify_relation_identifier(
+                node["name"], node.get("relation_name")
+            ),
+            schema=node["schema"],
+            database=node.get("database"),
+            relation_name=node.get("relation_name"),
+            version=str(version) if version else version,
+            latest_version=str(latest_version) if latest_version else latest_version,
+            deprecation_date=parse_datetime(node.get("deprecation_date")),
+            access=node.get("access") or config.get("access", "protected"),
+            depends_on_nodes=[
+                node_id
+                for node_id in depends_on.get("nodes", [])
+                if node_id.split(".")[0] != "source"
+            ],
+            enabled=node.get("enabled", True),
+            generated_at=generated_at,
+        )
+
+    return output
+
+
+@dataclass
+class LoomManifestSummary:
+    """A compact record of an upstream manifest that has been loaded by dbt-loom."""
+
+    name: str
+    reference_name: str
+    metadata: Dict
+    node_count: int
+    injected_node_count: int
+
+
 @dataclass
 class LoomRunnableConfig:
     """A shim class to allow is_invalid_*_ref functions to correctly handle access for loom-injected models."""
@@ -125,11 +328,46 @@ class dbtLoom(dbtPlugin):
             os.environ.get("DBT_LOOM_CONFIG", "dbt_loom.config.yml")
         )
 
-        self._manifest_loader = ManifestLoader()
-        self.manifests: Dict[str, Dict] = {}
-
         self.config: Optional[dbtLoomConfig] = self.read_config(configuration_path)
+
+        self._manifest_loader = ManifestLoader(
+            cache=ManifestCache(path=self.config.cache.path, ttl=self.config.cache.ttl)
+            if self.config and self.config.cache
+            else None,
+            streaming=self.config.streaming if self.config else False,
+            json_backend=self.config.json_backend.value if self.config else "json",
+            session=create_session(
+                connect_timeout=self.config.http.connect_timeout,
+                read_timeout=self.config.http.read_timeout,
+                retries=self.config.http.retries,
+                backoff_factor=self.config.http.backoff_factor,
+                pool_maxsize=max(10, self.config.max_concurrency),
+            )
+            if self.config
+            else None,
+        )
+        store_version = ":".join(
+            importlib.metadata.version(package) for package in ("dbt-loom", "dbt-core")
+        )
+        self._deltas: Optional[DeltaStore] = (
+            DeltaStore(path=self.config.cache.path, version=store_version)
+            if self.config and self.config.cache and self.config.cache.delta
+            else None
+        )
+        self._snapshots: Optional[SnapshotStore] = (
+            SnapshotStore(path=self.config.cache.path, version=store_version)
+            if self.config and self.config.cache and self.config.cache.snapshot
+            else None
+        )
+        self.manifests: Dict[str, LoomManifestSummary] = {}
         self.models: Dict[str, LoomModelNodeArgs] = {}
+        # A stable fingerprint of the injected nodes, set once they are loaded.
+        self.fingerprint: Optional[str] = None
+        self.timings: List[TimingRecorder] = []
+        self._referenced_nodes: Optional[Set[Tuple[str, str]]] = None
+        self._pruned_node_ids: Set[str] = set()
+        self._pruned_refs: Set[Tuple[str, str]] = set()
+        self._groups: Optional[FrozenSet[str]] = None
 
         self._patch_ref_protection()
 
@@ -141,6 +379,7 @@ class dbtLoom(dbtPlugin):
     def _patch_ref_protection(self) -> None:
         """Patch out the ref protection functions for proper protections"""
         import dbt.contracts.graph.manifest
+        import dbt.parser.manifest
 
         fire_event(
             msg="dbt-loom: Patching ref protection methods to support dbt-loom dependencies."
@@ -153,6 +392,19 @@ class dbtLoom(dbtPlugin):
             self.dependency_wrapper(is_invalid_private_ref)
         )
 
+        # Refs to pruned nodes are only explained when pruning is enabled, so that
+        # ref resolution is not wrapped otherwise.
+        if (
+            self.config is not None
+            and self.config.lazy_loading is not None
+            and self.config.lazy_loading.prune_nodes
+        ):
+            dbt.contracts.graph.manifest.Manifest.resolve_ref = (  # type: ignore
+                self.resolve_ref_wrapper(
+                    dbt.contracts.graph.manifest.Manifest.resolve_ref  # type: ignore
+                )
+            )
+
         dbt.parser.manifest.ManifestLoader.check_valid_group_config_node = (  # type: ignore
             self.group_validation_wrapper(
                 dbt.parser.manifest.ManifestLoader.check_valid_group_config_node  # type: ignore
@@ -172,18 +424,21 @@ class dbtLoom(dbtPlugin):
     def tracking_wrapper(self, function) -> Callable:
         """Wrap the telemetry `track` function and return early if we're tracking plugin actions."""
 
+        identifiers = frozenset((self.__class__.__name__, "dbt-loom", "dbt_loom"))
+
         def outer_function(*args, **kwargs):
-            """Check the context of the snowplow tracker message for references to loom. Return if present."""
-
-            if any(
-                [
-                    self.__class__.__name__ in str(context_item.__dict__)
-                    or "dbt-loom" in str(context_item.__dict__)
-                    or "dbt_loom" in str(context_item.__dict__)
-                    for context_item in kwargs.get("context", [])
-                ]
-            ):
-                return
+            """
+            Check the data of the snowplow tracker's self-describing context for
+            references to loom, like the `plugin_name` of plugin events. Return if present.
+            """
+
+            for context_item in kwargs.get("context") or ():
+                data = getattr(context_item, "data", None)
+                if isinstance(data, dict) and any(
+                    isinstance(value, str) and value in identifiers
+                    for value in data.values()
+                ):
+                    return
 
             return function(*args, **kwargs)
 
@@ -200,19 +455,58 @@ class dbtLoom(dbtPlugin):
 
         return outer_function
 
+    def resolve_ref_wrapper(self, function) -> Callable:
+        """Wrap the resolve_ref function to explain refs to nodes that dbt-loom pruned."""
+
+        def outer_function(inner_self, *args, **kwargs):
+            node = function(inner_self, *args, **kwargs)
+            if node is not None or not self._pruned_refs:
+                return node
+
+            # resolve_ref(source_node, target_model_name, target_model_package, ...)
+            arguments = dict(
+                zip(("source_node", "target_model_name", "target_model_package"), args),
+                **kwargs,
+            )
+            target_model_name = arguments.get("target_model_name")
+            target_model_package = arguments.get("target_model_package")
+            if (target_model_package, target_model_name) in self._pruned_refs:
+                fire_event(
+                    msg=f"dbt-loom: `ref('{target_model_package}', "
+                    f"'{target_model_name}')` refers to a node that was pruned, "
+                    "since no ref to it was found when scanning the project. Add "
+                    "the project to `lazy_loading.projects` to inject all of its nodes."
+                )
+
+            return node
+
+        return outer_function
+
     def group_validation_wrapper(self, function) -> Callable:
         """Wrap the check_valid_group_config_node function to inject upstream group names."""
 
+        # Memoize the union of the last set of valid group names with the injected
+        # groups, since dbt reuses the same set of names for every node.
+        cached_key: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None
+        cached_union: Set[str] = set()
+
         def outer_function(
             inner_self, groupable_node, valid_group_names: Set[str]
         ) -> bool:
-            new_groups: Set[str] = {
-                model.group for model in self.models.values() if model.group is not None
-            }
+            nonlocal cached_key, cached_union
 
-            return function(
-                inner_self, groupable_node, valid_group_names.union(new_groups)
-            )
+            # Only nodes with a group that is not defined locally need the upstream
+            # group names, so avoid building the union for every other node.
+            group = groupable_node.group
+            if not group or group in valid_group_names:
+                return function(inner_self, groupable_node, valid_group_names)
+
+            key = (frozenset(valid_group_names), self.get_groups())
+            if key != cached_key:
+                cached_key = key
+                cached_union = valid_group_names.union(self.get_groups())
+
+            return function(inner_self, groupable_node, cached_union)
 
         return outer_function
 
@@ -229,12 +523,19 @@ class dbtLoom(dbtPlugin):
 
         return outer_function
 
-    def get_groups(self) -> Set[str]:
+    def get_groups(self) -> FrozenSet[str]:
         """Get all groups defined in injected models."""
 
-        return {
-            model.group for model in self.models.values() if model.group is not None
-        }
+        if self._groups is None:
+            self._groups = frozenset(
+                model.group for model in self.models.values() if model.group is not None
+            )
+
+        return self._groups
+
+    def invalidate_groups(self) -> None:
+        """Clear the cached set of injected groups. Call this when `models` changes."""
+        self._groups = None
 
     def read_config(self, path: Path) -> Optional[dbtLoomConfig]:
         """Read the dbt-loom configuration file."""
@@ -261,40 +562,315 @@ class dbtLoom(dbtPlugin):
             config_str,
         )
 
+    def _select_references(self) -> List[ManifestReference]:
+        """
+        Select the manifest references to load. When lazy loading is enabled, only
+        references to projects that are referenced by the current project, or that
+        are explicitly listed, are loaded.
+        """
+        assert self.config is not None
+
+        lazy_loading = self.config.lazy_loading
+        if lazy_loading is None:
+            return list(self.config.manifests)
+
+        project_dir = Path(getattr(get_flags(), "PROJECT_DIR", None) or os.getcwd())
+        paths = (
+            [project_dir / path for path in lazy_loading.paths]
+            if lazy_loading.paths is not None
+            else project_paths(project_dir)
+        )
+        refs = find_cross_project_refs(paths)
+        if lazy_loading.prune_nodes:
+            self._referenced_nodes = refs
+
+        referenced_projects = {project for project, _ in refs}.union(
+            lazy_loading.projects
+        )
+
+        references = []
+        for reference in self.config.manifests:
+            if reference.name not in referenced_projects:
+                fire_event(
+                    msg=f"dbt-loom: Skipping manifest for `{reference.name}`, "
+                    "since it is not referenced by this project"
+                )
+                continue
+            references.append(reference)
+
+        return references
+
+    def _load_reference(
+        self,
+        manifest_reference: ManifestReference,
+        timings: Optional[TimingRecorder] = None,
+    ) -> Optional[Tuple[LoomManifestSummary, Dict[str, LoomModelNodeArgs]]]:
+        """
+        Load a single manifest reference and convert its nodes into
+        LoomModelNodeArgs, or reuse the nodes snapshotted for an unchanged manifest.
+        Returns None if an optional reference could not be loaded.
+        The raw manifest is released once its nodes have been converted. Each phase
+        of loading is recorded in `timings`, if provided.
+        """
+
+        fire_event(
+            msg=f"dbt-loom: Loading manifest for `{manifest_reference.name}`"
+            f" from `{manifest_reference.type.value}`"
+        )
+
+        reference_key = ManifestCache.key(
+            f"{manifest_reference.type.value}:{manifest_reference.config!r}"
+        )
+        load_manifest: Callable[[], Optional[Dict]] = functools.partial(
+            self._manifest_loader.load, manifest_reference, timings=timings
+        )
+
+        # With snapshots, an unchanged manifest is identified by its content hash,
+        # and its nodes are injected without parsing or converting it again.
+        snapshot: Optional[Snapshot] = None
+        snapshot_key: Optional[str] = None
+        if self._snapshots is not None:
+            identity = self._manifest_loader.identify(
+                manifest_reference, timings=timings
+            )
+            if identity is not None:
+                content_hash, load_manifest = identity
+                snapshot_key = self._snapshots.key(
+                    content_hash,
+                    manifest_reference,
+                    validate_nodes=self.config is None or self.config.validate_nodes,
+                )
+                with timed_phase(timings, "snapshot") as timing:
+                    snapshot = self._snapshots.get(reference_key, snapshot_key)
+                    timing.nodes = len(snapshot.nodes) if snapshot else 0
+
+        if snapshot is not None:
+            fire_event(
+                msg="dbt-loom: Using snapshot of the nodes converted for "
+                f"`{manifest_reference.name}`"
+            )
+            metadata = snapshot.metadata
+            node_count = snapshot.node_count
+            loom_nodes = snapshot.nodes
+        else:
+            converted = self._convert_reference(
+                manifest_reference, load_manifest, reference_key, timings=timings
+            )
+            if converted is None:
+                return None
+
+            metadata, node_count, loom_nodes = converted
+            if self._snapshots is not None and snapshot_key is not None:
+                self._snapshots.put(
+                    reference_key,
+                    Snapshot(
+                        key=snapshot_key,
+                        metadata=metadata,
+                        node_count=node_count,
+                        nodes=loom_nodes,
+                    ),
+                )
+
+        # Find the official project name from the manifest metadata and use that as the manifests key.
+        summary = LoomManifestSummary(
+            name=metadata.get("project_name", manifest_reference.name),
+            reference_name=manifest_reference.name,
+            metadata=metadata,
+            node_count=node_count,
+            injected_node_count=len(loom_nodes),
+        )
+
+        if timings is not None:
+            fire_event(msg=f"dbt-loom: Loaded {timings.describe()}")
+
+        return summary, loom_nodes
+
+    def _convert_reference(
+        self,
+        manifest_reference: ManifestReference,
+        load_manifest: Callable[[], Optional[Dict]],
+        reference_key: str,
+        timings: Optional[TimingRecorder] = None,
+    ) -> Optional[Tuple[Dict, int, Dict[str, LoomModelNodeArgs]]]:
+        """
+        Load a manifest and convert its nodes into LoomModelNodeArgs. Returns the
+        manifest's metadata, its node count, and the converted nodes, or None if an
+        optional reference could not be loaded.
+        """
+
+        manifest = load_manifest()
+        if manifest is None:
+            return None
+
+        metadata = manifest.get("metadata", {})
+        node_count = len(manifest.get("nodes", {}))
+        generated_at = manifest_generated_at(metadata)
+
+        node_filter: Optional[NodeFilter] = NodeFilter.from_reference(
+            manifest_reference
+        )
+
+        # In delta mode, only nodes that changed since the previous run are
+        # validated and converted, and the rest are reused from the delta store.
+        if self._deltas is not None:
+            with timed_phase(timings, "delta") as timing:
+                previous = self._deltas.get(reference_key)
+                changed, fingerprints, reused = partition_nodes(
+                    manifest, previous, node_filter=node_filter
+                )
+                timing.nodes = len(reused)
+            manifest = {"nodes": changed}
+            node_filter = None
+
+        if self.config is not None and not self.config.validate_nodes:
+            with timed_phase(timings, "convert") as timing:
+                loom_nodes = convert_raw_nodes_to_model_node_args(
+                    manifest, node_filter, generated_at=generated_at
+                )
+                timing.nodes = len(loom_nodes)
+        else:
+            with timed_phase(timings, "select") as timing:
+                selected_nodes = identify_node_subgraph(
+                    manifest, node_filter=node_filter
+                )
+                timing.nodes = len(selected_nodes)
+
+            with timed_phase(timings, "convert") as timing:
+                loom_nodes = convert_model_nodes_to_model_node_args(
+                    selected_nodes, generated_at=generated_at
+                )
+                timing.nodes = len(loom_nodes)
+            del selected_nodes
+        del manifest
+
+        if self._deltas is not None:
+            # Reused nodes were converted from an earlier version of the manifest.
+            for node in reused.values():
+                node.generated_at = generated_at
+            loom_nodes.update(reused)
+            loom_nodes = {
+                unique_id: loom_nodes[unique_id]
+                for unique_id in fingerprints
+                if unique_id in loom_nodes
+            }
+            if changed or previous.keys() != loom_nodes.keys():
+                self._deltas.put(
+                    reference_key,
+                    {
+                        unique_id: (fingerprints[unique_id], node)
+                        for unique_id, node in loom_nodes.items()
+                    },
+                )
+
+        return metadata, node_count, loom_nodes
+
+    def _prune_nodes(
+        self, summary: LoomManifestSummary, loom_nodes: Dict[str, LoomModelNodeArgs]
+    ) -> Dict[str, LoomModelNodeArgs]:
+        """Prune the nodes of a reference down to the nodes referenced by this project."""
+        assert self._referenced_nodes is not None
+        assert self.config is not None and self.config.lazy_loading is not None
+
+        pruned_nodes = prune_model_node_args(
+            loom_nodes,
+            self._referenced_nodes,
+            unpruned_packages=frozenset(self.config.lazy_loading.projects),
+        )
+
+        for unique_id, node in loom_nodes.items():
+            if unique_id not in pruned_nodes:
+                self._pruned_node_ids.add(unique_id)
+                self._pruned_refs.add((node.package_name, node.name))
+
+        fire_event(
+            msg=f"dbt-loom: Injecting {len(pruned_nodes)} of {len(loom_nodes)} "
+            f"nodes from `{summary.reference_name}`"
+        )
+        summary.injected_node_count = len(pruned_nodes)
+        return pruned_nodes
+
+    def _remove_pruned_dependencies(self) -> None:
+        """Remove dependencies on pruned nodes, since dbt cannot resolve them."""
+        if not self._pruned_node_ids:
+            return
+
+        for unique_id, node in self.models.items():
+            if self._pruned_node_ids.isdisjoint(node.depends_on_nodes):
+                continue
+
+            node = copy.copy(node)
+            node.depends_on_nodes = [
+                dependency
+                for dependency in node.depends_on_nodes
+                if dependency not in self._pruned_node_ids
+            ]
+            self.models[unique_id] = node
+
     def initialize(self) -> None:
         """Initialize the plugin"""
 
         if self.models != {} or not self.config:
             return
 
-        for manifest_reference in self.config.manifests:
-            fire_event(
-                msg=f"dbt-loom: Loading manifest for `{manifest_reference.name}`"
-                f" from `{manifest_reference.type.value}`"
-            )
-
-            manifest = self._manifest_loader.load(manifest_reference)
-            if manifest is None:
+        start = time.perf_counter()
+        references = self._select_references()
+        self.timings = [
+            TimingRecorder(name=reference.name, type=reference.type.value)
+            for reference in references
+        ]
+
+        # Fetch and convert references concurrently, but merge the results in
+        # configuration order so that the injected nodes remain deterministic.
+        max_workers = max(1, min(self.config.max_concurrency, len(references)))
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dbt-loom"
+        )
+        try:
+            self._manifest_loader.prepare(references)
+            results = list(executor.map(self._load_reference, references, self.timings))
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            self._manifest_loader.close()
+        executor.shutdown()
+
+        for result in results:
+            if result is None:
                 continue
 
-            # Find the official project name from the manifest metadata and use that as the manifests key.
-            manifest_name = manifest.get("metadata", {}).get(
-                "project_name", manifest_reference.name
-            )
-            self.manifests[manifest_name] = manifest
+            summary, loom_nodes = result
+            if self._referenced_nodes is not None:
+                loom_nodes = self._prune_nodes(summary, loom_nodes)
+            self.manifests[summary.name] = summary
+            # Sort each reference's nodes, so that the injected nodes do not
+            # depend on the order of nodes in the upstream manifest.
+            self.models.update(sorted(loom_nodes.items()))
 
-            selected_nodes = identify_node_subgraph(manifest)
+        if self._referenced_nodes is not None:
+            self._remove_pruned_dependencies()
 
-            # Remove nodes from excluded packages.
-            filtered_nodes = {
-                key: value
-                for key, value in selected_nodes.items()
-                if value.package_name not in manifest_reference.excluded_packages
-            }
+        self.invalidate_groups()
+        self.get_groups()
 
-            loom_nodes = convert_model_nodes_to_model_node_args(filtered_nodes)
+        self.fingerprint = fingerprint_model_node_args(self.models)
+        fire_event(
+            msg=f"dbt-loom: Loaded {len(self.models)} nodes with fingerprint "
+            f"`{self.fingerprint}`"
+        )
 
-            self.models.update(loom_nodes)
+        if self.config.timings:
+            write_timings(
+                self.config.timings.path,
+                self.timings,
+                dbt_loom_version=importlib.metadata.version("dbt-loom"),
+                generated_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                seconds=time.perf_counter() - start,
+                max_concurrency=self.config.max_concurrency,
+                json_backend=self.config.json_backend.value,
+                injected_node_count=len(self.models),
+                fingerprint=self.fingerprint,
+            )
 
     @dbt_hook
     def get_nodes(self) -> PluginNodes:
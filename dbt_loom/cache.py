@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from dbt_loom.payload import ManifestPayload
+
+# The size of the chunks used when streaming payloads into the cache.
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Hash the contents of a file with SHA-256, reading it in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Metadata describing a cached manifest for a single manifest reference."""
+
+    content_hash: str
+    name: str
+    fetched_at: float
+    version: Optional[str] = None
+    last_modified: Optional[str] = None
+    size: Optional[int] = None
+
+
+class ManifestCache:
+    """
+    A content-addressed, on-disk cache of raw manifest payloads. Manifest
+    contents are stored once per content hash under `objects/`, and each
+    manifest reference points at its current object from `references/`.
+    """
+
+    def __init__(self, path: Path, ttl: int = 0) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(identity: str) -> str:
+        """Generate a stable cache key for a manifest reference identity."""
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _reference_path(self, key: str) -> Path:
+        return self.path / "references" / f"{key}.json"
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self.path / "objects" / content_hash
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        """Write a file atomically so that concurrent readers never see partial data."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the cache entry for a key, if a valid one exists."""
+        try:
+            entry = CacheEntry(**json.loads(self._reference_path(key).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if not self._object_path(entry.content_hash).exists():
+            return None
+
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check if an entry may be used without revalidating it."""
+        return time.time() - entry.fetched_at < self.ttl
+
+    def read(self, entry: CacheEntry) -> ManifestPayload:
+        """Read the payload stored for a cache entry as a stream."""
+        return ManifestPayload(
+            content=None,
+            name=entry.name,
+            version=entry.version,
+            last_modified=entry.last_modified,
+            stream=open(self._object_path(entry.content_hash), "rb"),
+        )
+
+    def put(self, key: str, payload: ManifestPayload) -> CacheEntry:
+        """
+        Store a payload for a key, replacing any previously cached payload. The
+        payload is consumed and closed, since streamed payloads are written to disk
+        as they are read.
+        """
+        objects_path = self.path / "objects"
+        objects_path.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=objects_path, prefix=".tmp")
+
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            with os.fdopen(file_descriptor, "wb") as file:
+                stream = payload.open()
+                try:
+                    for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        file.write(chunk)
+                finally:
+                    payload.close()
+
+            entry = CacheEntry(
+                content_hash=digest.hexdigest(),
+                name=payload.name,
+                fetched_at=time.time(),
+                version=payload.version,
+                last_modified=payload.last_modified,
+                size=size,
+            )
+
+            with self._lock:
+                previous = self.get(key)
+
+                object_path = self._object_path(entry.content_hash)
+                if object_path.exists():
+                    Path(temp_path).unlink()
+                else:
+                    os.replace(temp_path, object_path)
+                self._write_entry(key, entry)
+
+                if previous and previous.content_hash != entry.content_hash:
+                    self._remove_unreferenced(previous.content_hash)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        return entry
+
+    def touch(self, key: str, entry: CacheEntry) -> CacheEntry:
+        """Mark an entry as freshly validated."""
+        entry.fetched_at = time.time()
+        with self._lock:
+            self._write_entry(key, entry)
+        return entry
+
+    def _write_entry(self, key: str, entry: CacheEntry) -> None:
+        self._write_atomic(
+            self._reference_path(key), json.dumps(asdict(entry)).encode("utf-8")
+        )
+
+    def _remove_unreferenced(self, content_hash: str) -> None:
+        """Remove a cached object if no reference points to it anymore."""
+        for reference_path in (self.path / "references").glob("*.json"):
+            try:
+                if (
+                    json.loads(reference_path.read_text()).get("content_hash")
+                    == content_hash
+                ):
+                    return
+            except (OSError, ValueError):
+                continue
+
+        self._object_path(content_hash).unlink(missing_ok=True)
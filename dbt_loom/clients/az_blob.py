@@ -1,13 +1,12 @@
-import json
 import os
-import gzip
-from io import BytesIO
-from typing import Dict
+from typing import Dict, Optional
 
 
 from pydantic import BaseModel
 
+from dbt_loom.clients.registry import ClientRegistry, get_client
 from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload, decode_manifest
 
 
 class AzureReferenceConfig(BaseModel):
@@ -22,38 +21,60 @@ class AzureClient:
     """A client for loading manifest files from Azure storage."""
 
     def __init__(
-        self, container_name: str, object_name: str, account_name: str
+        self,
+        container_name: str,
+        object_name: str,
+        account_name: str,
+        registry: Optional[ClientRegistry] = None,
     ) -> None:
         self.account_name = account_name
         self.container_name = container_name
         self.object_name = object_name
+        self.registry = registry
 
-    def load_manifest(self) -> Dict:
-        """Load the manifest.json file from Azure storage."""
+    def _create_client(self, connection_string: Optional[str]):
+        """Create a blob service client for the configured storage account."""
+
+        from azure.identity import DefaultAzureCredential
+        from azure.storage.blob import BlobServiceClient
+
+        if connection_string:
+            return BlobServiceClient.from_connection_string(connection_string)
+
+        # Credential discovery is independent of the account, so share it as well.
+        credential = get_client(
+            self.registry, ("azure_credential",), DefaultAzureCredential
+        )
+        account_url = f"{self.account_name}.blob.core.windows.net"
+        return BlobServiceClient(account_url, credential=credential)
+
+    def fetch(self, version: Optional[str] = None) -> Optional[ManifestPayload]:
+        """
+        Fetch the raw manifest blob from Azure storage. If a version (ETag) is
+        provided and the blob has not changed, return None.
+        """
 
         try:
-            from azure.identity import DefaultAzureCredential
+            from azure.identity import DefaultAzureCredential  # noqa: F401
         except ImportError:
             fire_event(msg="dbt-loom expected azure-identity to be installed.")
             raise
 
         try:
-            from azure.storage.blob import BlobServiceClient
+            from azure.core import MatchConditions
+            from azure.core.exceptions import ResourceNotModifiedError
+            from azure.storage.blob import BlobServiceClient  # noqa: F401
         except ImportError:
             fire_event(msg="dbt-loom expected azure-storage-blob to be installed.")
             raise
 
         connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
         try:
-            if connection_string:
-                blob_service_client = BlobServiceClient.from_connection_string(
-                    connection_string
-                )
-            else:
-                account_url = f"{self.account_name}.blob.core.windows.net"
-                blob_service_client = BlobServiceClient(
-                    account_url, credential=DefaultAzureCredential()
-                )
+            blob_service_client = get_client(
+                self.registry,
+                ("azure", connection_string or self.account_name),
+                lambda: self._create_client(connection_string),
+            )
             blob_client = blob_service_client.get_blob_client(
                 container=self.container_name, blob=self.object_name
             )
@@ -62,22 +83,40 @@ class AzureClient:
                 "Unable to connect to Azure. Please confirm your credentials, connection details, and network."
             )
 
-        # Deserialize the body of the object.
+        conditions = (
+            {"etag": version, "match_condition": MatchConditions.IfModified}
+            if version
+            else {}
+        )
+
         try:
-            if self.object_name.endswith(".gz"):
-                with gzip.GzipFile(
-                    fileobj=BytesIO(blob_client.download_blob().readall())
-                ) as gzipfile:
-                    content = gzipfile.read().decode("utf-8")
-            else:
-                content = blob_client.download_blob(encoding="utf-8").readall()
+            downloader = blob_client.download_blob(**conditions)
+        except ResourceNotModifiedError:
+            return None
         except Exception:
             raise Exception(
                 f"Unable to read the data contained in the object `{self.object_name}"
             )
 
+        last_modified = downloader.properties.last_modified
+        # The downloader is read in chunks as the manifest is decoded.
+        return ManifestPayload(
+            content=None,
+            name=self.object_name,
+            version=downloader.properties.etag,
+            last_modified=str(last_modified) if last_modified else None,
+            stream=downloader,  # type: ignore
+        )
+
+    def load_manifest(self) -> Dict:
+        """Load the manifest.json file from Azure storage."""
+
+        payload = self.fetch()
+        assert payload is not None
+
+        # Deserialize the body of the object.
         try:
-            return json.loads(content)
+            return decode_manifest(payload)
         except Exception:
             raise Exception(
                 f"The object `{self.object_name}` does not contain valid JSON."
@@ -5,6 +5,8 @@ from pydantic import BaseModel
 import requests
 
 from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload
+from dbt_loom.sessions import create_session
 
 
 class DbtCloudReferenceConfig(BaseModel):
@@ -24,6 +26,7 @@ class DbtCloud:
         account_id: int,
         token: Optional[str] = None,
         api_endpoint: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         resolved_token = token or os.environ.get("DBT_CLOUD_API_TOKEN")
         if resolved_token is None:
@@ -37,12 +40,13 @@ class DbtCloud:
 
         self.account_id = account_id
         self.api_endpoint = api_endpoint or "https://cloud.getdbt.com/api/v2"
+        self.session = session or create_session()
 
-    def _query(self, endpoint: str, **kwargs) -> Dict:
-        """Query the dbt Cloud Administrative API."""
+    def _request(self, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request to the dbt Cloud Administrative API."""
         url = f"{self.api_endpoint}/{endpoint}"
         fire_event(msg=f"Querying {url}")
-        response = requests.get(
+        return self.session.get(
             url,
             headers={
                 "authorization": "Bearer " + self.__token,
@@ -50,19 +54,29 @@ class DbtCloud:
             },
             **kwargs,
         )
-        return response.json()
 
-    def _get_manifest(self, run_id: int, step: Optional[int] = None) -> Dict[str, Any]:
-        """Get the manifest json for a given dbt Cloud run."""
+    def _query(self, endpoint: str, **kwargs) -> Dict:
+        """Query the dbt Cloud Administrative API."""
+        return self._request(endpoint, **kwargs).json()
+
+    def _get_manifest_response(
+        self, run_id: int, step: Optional[int] = None, stream: bool = False
+    ) -> requests.Response:
+        """Get the raw manifest response for a given dbt Cloud run."""
         params = {}
         if step:
             params["step"] = step
 
-        return self._query(
+        return self._request(
             f"accounts/{self.account_id}/runs/{run_id}/artifacts/manifest.json",
             params=params,
+            stream=stream,
         )
 
+    def _get_manifest(self, run_id: int, step: Optional[int] = None) -> Dict[str, Any]:
+        """Get the manifest json for a given dbt Cloud run."""
+        return self._get_manifest_response(run_id=run_id, step=step).json()
+
     def _get_latest_run(self, job_id: int) -> Dict[str, Any]:
         """Get the latest run performed by a dbt Cloud job."""
         return self._query(
@@ -75,6 +89,33 @@ class DbtCloud:
             },
         )["data"][0]
 
+    def fetch(
+        self, job_id: int, step: Optional[int] = None, version: Optional[str] = None
+    ) -> Optional[ManifestPayload]:
+        """
+        Fetch the raw manifest for the latest run of a dbt Cloud job. If a version
+        (the run ID) is provided and no newer run exists, return None.
+        """
+        latest_run = self._get_latest_run(job_id=job_id)
+        run_id = str(latest_run["id"])
+        if version == run_id:
+            return None
+
+        response = self._get_manifest_response(
+            run_id=latest_run["id"], step=step, stream=True
+        )
+        response.raise_for_status()
+
+        # Stream the body, while still honoring any Content-Encoding of the response.
+        response.raw.decode_content = True
+        return ManifestPayload(
+            content=None,
+            name="manifest.json",
+            version=run_id,
+            last_modified=latest_run.get("finished_at"),
+            stream=response.raw,
+        )
+
     def get_models(self, job_id: int, step: Optional[int] = None) -> Dict[str, Any]:
         """Get the latest state of all models by Job ID."""
         latest_run = self._get_latest_run(job_id=job_id)
@@ -1,8 +1,8 @@
 import json
-import gzip
-from io import BytesIO
-from typing import Dict
+from typing import Dict, Optional
+from dbt_loom.clients.registry import ClientRegistry, get_client
 from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload, decode_manifest
 from pydantic import BaseModel
 from urllib.parse import ParseResult, unquote
 
@@ -16,8 +16,9 @@ class DatabricksReferenceConfig(BaseModel):
 class DatabricksClient:
     """A client for loading manifest files from Databricks."""
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, registry: Optional[ClientRegistry] = None) -> None:
         self.path = path
+        self.registry = registry
 
     def _get_path_str(self):
         """
@@ -36,8 +37,11 @@ class DatabricksClient:
             # If the path type is not supported, raise a TypeError.
             raise TypeError(f"Unsupported path type: {type(self.path)}")
 
-    def load_manifest(self) -> Dict:
-        """Load the manifest.json file from Databricks."""
+    def fetch(self, version: Optional[str] = None) -> Optional[ManifestPayload]:
+        """
+        Fetch the raw manifest file from Databricks. If a version (the file's last
+        modified time) is provided and the file has not changed, return None.
+        """
 
         # Import the Databricks SDK, which is a dependency of the dbt-databricks adapter
         try:
@@ -49,48 +53,83 @@ class DatabricksClient:
             raise
 
         try:
-            # Initialize the workspace client; auth is handled via Databricks Unified Authentication model
-            w = WorkspaceClient()
+            # Initialize the workspace client; auth is handled via Databricks Unified Authentication model.
+            # The client is shared by every Databricks reference, so auth is only resolved once.
+            w = get_client(self.registry, ("databricks",), WorkspaceClient)
             path_str = self._get_path_str()
             downloaded_bytes = None
+            stream = None
+            last_modified = None
 
-            # If it's a Databricks Workspace path (e.g., /Workspace/Users/...), use workspace.export.
-            # This API returns content that might be base64 encoded.
+            # If it's a Databricks Workspace path (e.g., /Workspace/Users/...), check the
+            # object's modification time before downloading it.
             if path_str.startswith("/Workspace/"):
-                resp = w.workspace.export(path_str, format=ExportFormat.AUTO)
-                export_content = resp.content
-                # Attempt base64 decode. If it fails, assume it's not base64 encoded and use raw content.
-                try:
-                    downloaded_bytes = base64.b64decode(export_content)
-                except Exception:
-                    downloaded_bytes = export_content if isinstance(export_content, bytes) else export_content.encode('utf-8')
+                status = w.workspace.get_status(path_str)
+                file_version = str(status.modified_at) if status.modified_at else None
+                if version is not None and file_version == version:
+                    return None
+
+                # Download the raw file contents directly when the SDK supports it.
+                if hasattr(w.workspace, "download"):
+                    stream = w.workspace.download(path_str, format=ExportFormat.AUTO)
+                # Otherwise, use workspace.export. This API returns content that might be base64 encoded.
+                else:
+                    resp = w.workspace.export(path_str, format=ExportFormat.AUTO)
+                    export_content = resp.content
+                    # Attempt base64 decode. If it fails, assume it's not base64 encoded and use raw content.
+                    try:
+                        downloaded_bytes = base64.b64decode(export_content)
+                    except Exception:
+                        downloaded_bytes = export_content if isinstance(export_content, bytes) else export_content.encode('utf-8')
             # If it's a DBFS path, use w.dbfs.download
             elif path_str.startswith("/dbfs/"):
                 # Remove the /dbfs prefix for w.dbfs.download as it expects paths relative to DBFS root
                 path_str = path_str[5:]
-                resp = w.dbfs.download(path_str)
-                downloaded_bytes = resp.read()
+                status = w.dbfs.get_status(path_str)
+                file_version = (
+                    str(status.modification_time) if status.modification_time else None
+                )
+                if version is not None and file_version == version:
+                    return None
+
+                stream = w.dbfs.download(path_str)
             # For other paths (e.g., Unity Catalog volumes or external locations), use files.download.
+            # The contents are streamed as the manifest is decoded.
             else:
+                # Only request metadata when there is a cached version to compare to,
+                # since downloads report the last modified time themselves.
+                if version is not None:
+                    metadata = w.files.get_metadata(path_str)
+                    if metadata.last_modified and metadata.last_modified == version:
+                        return None
+
                 resp = w.files.download(path_str)
-                downloaded_bytes = resp.contents.read()
+                stream = resp.contents
+                file_version = last_modified = resp.last_modified
         except Exception:
             fire_event(msg="Unable to retrieve file from Databricks.")
             raise
 
+        return ManifestPayload(
+            content=downloaded_bytes,
+            name=path_str,
+            version=file_version,
+            last_modified=last_modified,
+            stream=stream,
+        )
+
+    def load_manifest(self) -> Dict:
+        """Load the manifest.json file from Databricks."""
+
+        payload = self.fetch()
+        assert payload is not None
+
         # Deserialize the object: handle gzip decompression and then load JSON.
         try:
-            content_string = None
-            if path_str.endswith('.gz'):
-                with gzip.GzipFile(fileobj=BytesIO(downloaded_bytes)) as gzipfile:
-                    content_string = gzipfile.read().decode('utf-8')
-            else:
-                content_string = downloaded_bytes.decode('utf-8')
-
-            return json.loads(content_string)
+            return decode_manifest(payload)
         except json.decoder.JSONDecodeError:
-            fire_event(msg=f"The object `{path_str}` does not contain valid JSON.")
+            fire_event(msg=f"The object `{payload.name}` does not contain valid JSON.")
             raise
         except Exception:
-            fire_event(msg=f"Unable to read the data contained in the object `{path_str}`")
+            fire_event(msg=f"Unable to read the data contained in the object `{payload.name}`")
             raise
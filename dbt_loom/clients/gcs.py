@@ -1,12 +1,14 @@
-import json
-import gzip
-from io import BytesIO
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
+from dbt_loom.clients.registry import ClientRegistry, get_client
 from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload, decode_manifest
+
+# The size of each ranged download. Most manifests are downloaded in one request.
+CHUNK_SIZE = 64 * 1024 * 1024
 
 
 class GCSReferenceConfig(BaseModel):
@@ -17,6 +19,51 @@ class GCSReferenceConfig(BaseModel):
     object_name: str
     credentials: Optional[Path] = None
     impersonate_service_account: Optional[str] = None
+    generation: Optional[int] = None
+
+
+class BlobChunkReader:
+    """
+    A byte stream that downloads a blob in ranged chunks. Each chunk is a single
+    GET request, so manifests smaller than the chunk size are downloaded with one
+    request. Later chunks are pinned to the generation of the first chunk.
+    """
+
+    def __init__(self, blob: Any, first_chunk: bytes, chunk_size: int) -> None:
+        self.blob = blob
+        self.chunk_size = chunk_size
+        self.buffer = first_chunk
+        self.position = len(first_chunk)
+        self.exhausted = len(first_chunk) < chunk_size
+
+    def _download_chunk(self) -> bytes:
+        from google.api_core.exceptions import RequestRangeNotSatisfiable
+
+        try:
+            chunk = self.blob.download_as_bytes(
+                start=self.position, end=self.position + self.chunk_size - 1
+            )
+        except RequestRangeNotSatisfiable:
+            # The object's size was an exact multiple of the chunk size.
+            chunk = b""
+
+        self.position += len(chunk)
+        self.exhausted = len(chunk) < self.chunk_size
+        return chunk
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            chunks = [self.buffer]
+            while not self.exhausted:
+                chunks.append(self._download_chunk())
+            self.buffer = b""
+            return b"".join(chunks)
+
+        if not self.buffer and not self.exhausted:
+            self.buffer = self._download_chunk()
+
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
 
 
 class GCSClient:
@@ -28,16 +75,20 @@ class GCSClient:
         bucket_name: str,
         object_name: str,
         credentials: Optional[Path] = None,
-        impersonate_service_account: Optional[str] = None
+        impersonate_service_account: Optional[str] = None,
+        generation: Optional[int] = None,
+        registry: Optional[ClientRegistry] = None,
     ) -> None:
         self.project_id = project_id
         self.bucket_name = bucket_name
         self.object_name = object_name
         self.credentials = credentials
         self.impersonate_service_account = impersonate_service_account
+        self.generation = generation
+        self.registry = registry
 
-    def load_manifest(self) -> Dict:
-        """Load a manifest json from a GCS bucket."""
+    def _create_client(self):
+        """Create a storage client for the configured project and credentials."""
 
         try:
             from google.cloud import storage
@@ -80,23 +131,85 @@ class GCSClient:
                 )
                 client = storage.Client(project=self.project_id)
 
-        bucket = client.get_bucket(self.bucket_name)
-        blob = bucket.get_blob(self.object_name)
-        if not blob:
+        return client
+
+    def fetch(self, version: Optional[str] = None) -> Optional[ManifestPayload]:
+        """
+        Fetch the raw manifest object from a GCS bucket. If a version (the
+        object generation) is provided and the object has not changed, return None.
+
+        The object is downloaded directly, without first requesting bucket or
+        object metadata, so manifests are usually fetched with a single request.
+        """
+
+        # Generations are immutable, so a pinned generation never needs revalidation.
+        if self.generation is not None and version == str(self.generation):
+            return None
+
+        client = get_client(
+            self.registry,
+            (
+                "gcs",
+                self.project_id,
+                self.credentials,
+                self.impersonate_service_account,
+            ),
+            self._create_client,
+        )
+
+        from google.api_core.exceptions import NotFound, NotModified
+
+        blob = client.bucket(self.bucket_name).blob(
+            self.object_name, generation=self.generation
+        )
+
+        conditions = (
+            {"if_generation_not_match": int(version)}
+            if version is not None and self.generation is None
+            else {}
+        )
+
+        try:
+            first_chunk = blob.download_as_bytes(
+                start=0, end=CHUNK_SIZE - 1, **conditions
+            )
+        except NotModified:
+            return None
+        except NotFound:
             raise Exception(
                 f"The object `{self.object_name}` does not exist in bucket "
                 f"`{self.bucket_name}`."
             )
 
-        if self.object_name.endswith(".gz"):
-            compressed_manifest = blob.download_as_bytes()
-            with gzip.GzipFile(fileobj=BytesIO(compressed_manifest)) as gzip_file:
-                manifest_json = gzip_file.read()
-        else:
-            manifest_json = blob.download_as_text()
+        # The download populates the blob's generation and content encoding from
+        # the response headers, and the generation pins any further downloads.
+        # Objects are revalidated by generation alone, since downloads do not
+        # populate the object's update time.
+        if blob.content_encoding == "gzip":
+            # Objects stored with `Content-Encoding: gzip` are decompressed as they
+            # are served, and GCS ignores the range of such requests. The first
+            # download therefore already holds the whole decoded object.
+            return ManifestPayload(
+                content=first_chunk,
+                name=self.object_name,
+                version=str(blob.generation),
+            )
+
+        return ManifestPayload(
+            content=None,
+            name=self.object_name,
+            version=str(blob.generation),
+            stream=BlobChunkReader(blob, first_chunk, CHUNK_SIZE),
+        )
+
+    def load_manifest(self) -> Dict:
+        """Load a manifest json from a GCS bucket."""
+
+        payload = self.fetch()
+        assert payload is not None
 
         try:
-            return json.loads(manifest_json)
+            return decode_manifest(payload)
         except Exception:
             raise Exception(
                 f"The object `{self.object_name}` does not contain valid JSON."
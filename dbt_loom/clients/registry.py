@@ -0,0 +1,71 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from dbt_loom.logging import fire_event
+
+T = TypeVar("T")
+
+
+class ClientRegistry:
+    """
+    A thread-safe registry of authenticated object store clients. Clients are
+    keyed by the account, project, and credentials they were created with, so
+    that references sharing a bucket or account reuse a single client, along with
+    its resolved credentials and connection pool.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Hashable, Any] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Get the client for a key, creating it with `factory` if it does not exist."""
+
+        with self._lock:
+            if key in self._clients:
+                return self._clients[key]
+            key_lock = self._locks.setdefault(key, threading.Lock())
+
+        # Create clients outside of the registry lock, so that credential discovery
+        # for one account does not block references to other accounts.
+        with key_lock:
+            with self._lock:
+                if key in self._clients:
+                    return self._clients[key]
+
+            client = factory()
+
+            with self._lock:
+                self._clients[key] = client
+
+        return client
+
+    def close(self) -> None:
+        """Close every registered client that supports closing, and clear the registry."""
+
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._locks.clear()
+
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+
+            try:
+                close()
+            except Exception as error:
+                fire_event(msg=f"dbt-loom: Unable to close client: {error}")
+
+
+def get_client(
+    registry: Optional[ClientRegistry], key: Hashable, factory: Callable[[], T]
+) -> T:
+    """Get a client from a registry, if one is provided, or create a new client."""
+
+    if registry is None:
+        return factory()
+
+    return registry.get(key, factory)
@@ -1,13 +1,12 @@
-import json
 from pathlib import Path
 from typing import Dict, Optional
 
 
-import gzip
-from io import BytesIO
 from pydantic import BaseModel
 
+from dbt_loom.clients.registry import ClientRegistry, get_client
 from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload, decode_manifest
 
 
 class S3ReferenceConfig(BaseModel):
@@ -21,12 +20,19 @@ class S3ReferenceConfig(BaseModel):
 class S3Client:
     """A client for loading manifest files from S3-compatible object stores."""
 
-    def __init__(self, bucket_name: str, object_name: str) -> None:
+    def __init__(
+        self,
+        bucket_name: str,
+        object_name: str,
+        registry: Optional[ClientRegistry] = None,
+    ) -> None:
         self.bucket_name = bucket_name
         self.object_name = object_name
+        self.registry = registry
 
-    def load_manifest(self) -> Dict:
-        """Load the manifest.json file from an S3 bucket."""
+    @staticmethod
+    def _create_client():
+        """Create an S3 client using the default credential chain."""
 
         try:
             import boto3
@@ -34,11 +40,24 @@ class S3Client:
             fire_event(msg="dbt-loom expected boto3 to be installed.")
             raise
 
-        client = boto3.client("s3")
+        return boto3.client("s3")
+
+    def fetch(self, version: Optional[str] = None) -> Optional[ManifestPayload]:
+        """
+        Fetch the raw manifest object from an S3 bucket. If a version (ETag) is
+        provided and the object has not changed, return None.
+        """
+
+        # S3 clients are not bound to a bucket, so every reference can share one.
+        client = get_client(self.registry, ("s3",), self._create_client)
+
+        conditions = {"IfNoneMatch": version} if version else {}
 
         # TODO: Determine if I need to add args for SSE
         try:
-            response = client.get_object(Bucket=self.bucket_name, Key=self.object_name)
+            response = client.get_object(
+                Bucket=self.bucket_name, Key=self.object_name, **conditions
+            )
         except client.exceptions.NoSuchBucket:
             raise Exception(f"The bucket `{self.bucket_name}` does not exist.")
         except client.exceptions.NoSuchKey:
@@ -46,22 +65,30 @@ class S3Client:
                 f"The object `{self.object_name}` does not exist in bucket "
                 f"`{self.bucket_name}`."
             )
+        except client.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") in ("304", "NotModified"):
+                return None
+            raise
 
-        # Deserialize the body of the object.
-        try:
-            if self.object_name.endswith(".gz"):
-                body = response["Body"].read()
-                with gzip.GzipFile(fileobj=BytesIO(body)) as gzipfile:
-                    content = gzipfile.read().decode("utf-8")
-            else:
-                content = response["Body"].read().decode("utf-8")
-        except Exception:
-            raise Exception(
-                f"Unable to read the data contained in the object `{self.object_name}"
-            )
+        # Stream the body of the object, rather than reading it into memory.
+        last_modified = response.get("LastModified")
+        return ManifestPayload(
+            content=None,
+            name=self.object_name,
+            version=response.get("ETag"),
+            last_modified=str(last_modified) if last_modified else None,
+            stream=response["Body"],
+        )
+
+    def load_manifest(self) -> Dict:
+        """Load the manifest.json file from an S3 bucket."""
 
+        payload = self.fetch()
+        assert payload is not None
+
+        # Deserialize the body of the object.
         try:
-            return json.loads(content)
+            return decode_manifest(payload)
         except Exception:
             raise Exception(
                 f"The object `{self.object_name}` does not contain valid JSON."
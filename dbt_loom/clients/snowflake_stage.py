@@ -1,32 +1,43 @@
-import gzip
-import json
+import shutil
 import tempfile
+import threading
 from pathlib import Path, PurePosixPath
-from typing import Dict
+from typing import IO, Dict, Iterable, List, Optional, Tuple
 
+import requests
 from dbt.config.runtime import load_profile
 from dbt.flags import get_flags
+from dbt_loom.clients.registry import ClientRegistry, get_client
 from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload, decode_manifest
+from dbt_loom.sessions import create_session
 from pydantic import BaseModel
 
+# The number of seconds that presigned URLs remain valid for.
+PRESIGNED_URL_EXPIRATION = 3600
+
 
 class SnowflakeReferenceConfig(BaseModel):
     """Configuration for an reference stored in Snowflake Stage"""
 
     stage: str
     stage_path: str
+    presigned_url: bool = False
 
 
-class SnowflakeClient:
-    """A client for loading manifest files from Snowflake Stage."""
+def quote_string(value: str) -> str:
+    """Quote a value as a Snowflake string literal."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
 
-    def __init__(self, stage: str, stage_path: str) -> None:
-        self.stage = stage
-        self.stage_path = stage_path.lstrip("/")
 
-    def load_manifest(self) -> Dict:
-        """Load the manifest.json file from Snowflake stage."""
+class SnowflakeConnection:
+    """
+    A Snowflake adapter shared by every Snowflake reference. The adapter is
+    initialized once, and each thread reuses a single open connection for every
+    query until the connection is closed.
+    """
 
+    def __init__(self) -> None:
         try:
             from dbt.adapters.snowflake import SnowflakeAdapter
         except ImportError as exception:
@@ -54,28 +65,211 @@ class SnowflakeClient:
             profile_name_override=flags.PROFILE,
             target_override=flags.TARGET,
         )
-        adapter = SnowflakeAdapter(profile, get_mp_context())
+        self.adapter = SnowflakeAdapter(profile, get_mp_context())
+        self.presigned_urls: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, query: str):
+        """Execute a query on this thread's connection, opening it if needed."""
+        self.adapter.connections.set_connection_name("dbt-loom")
+        return self.adapter.connections.execute(query, fetch=True)
+
+    def prefetch_presigned_urls(self, locations: Iterable[Tuple[str, str]]) -> None:
+        """Generate presigned URLs for several stage locations in a single query."""
+
+        with self._lock:
+            missing = list(
+                dict.fromkeys(
+                    location
+                    for location in locations
+                    if location not in self.presigned_urls
+                )
+            )
+
+        if not missing:
+            return
+
+        columns = ", ".join(
+            f"get_presigned_url(@{stage}, {quote_string(stage_path)}, "
+            f"{PRESIGNED_URL_EXPIRATION})"
+            for stage, stage_path in missing
+        )
+        _, table = self.execute(f"select {columns}")
+
+        with self._lock:
+            self.presigned_urls.update(zip(missing, table.rows[0]))
+
+    def file_version(
+        self, stage: str, stage_path: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the MD5 digest and last modified time of a staged file, which are used
+        to revalidate cached manifests without downloading them again.
+        """
+        _, table = self.execute(f"list @{stage}/{stage_path}")
+
+        # Listing a path matches every file with that prefix, so find the exact file.
+        for row in table.rows:
+            if str(row["name"]).endswith(f"/{stage_path}"):
+                last_modified = row["last_modified"]
+                version = row["md5"] or last_modified
+                return (
+                    str(version) if version else None,
+                    str(last_modified) if last_modified else None,
+                )
+
+        return None, None
+
+    def presigned_url(self, stage: str, stage_path: str) -> str:
+        """Get a presigned URL for a stage location, generating it if needed."""
+        self.prefetch_presigned_urls([(stage, stage_path)])
+        return self.presigned_urls[(stage, stage_path)]
+
+    def close(self) -> None:
+        """Close every connection opened by the adapter."""
+        self.adapter.cleanup_connections()
+
+
+class TemporaryFileReader:
+    """
+    A byte stream for a file in a temporary directory. The directory is removed
+    once the stream is closed.
+    """
+
+    def __init__(self, path: Path, directory: str) -> None:
+        self.file: IO[bytes] = path.open("rb")
+        self.directory = directory
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def close(self) -> None:
+        self.file.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class SnowflakeClient:
+    """A client for loading manifest files from Snowflake Stage."""
+
+    def __init__(
+        self,
+        stage: str,
+        stage_path: str,
+        presigned_url: bool = False,
+        registry: Optional[ClientRegistry] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.stage = stage
+        self.stage_path = stage_path.lstrip("/")
+        self.presigned_url = presigned_url
+        self.registry = registry
+        self.session = session
+
+    @staticmethod
+    def connection(registry: Optional[ClientRegistry] = None) -> SnowflakeConnection:
+        """Get the Snowflake connection shared by the references in a registry."""
+        return get_client(registry, ("snowflake",), SnowflakeConnection)
+
+    @staticmethod
+    def prefetch(
+        clients: List["SnowflakeClient"], registry: Optional[ClientRegistry] = None
+    ) -> None:
+        """Generate the presigned URLs for several clients with a single query."""
+        locations = [
+            (client.stage, client.stage_path)
+            for client in clients
+            if client.presigned_url
+        ]
+        if locations:
+            SnowflakeClient.connection(registry).prefetch_presigned_urls(locations)
+
+    def fetch(
+        self, version: Optional[str] = None, versioned: bool = True
+    ) -> Optional[ManifestPayload]:
+        """
+        Fetch the raw manifest file from a Snowflake stage. With presigned URLs, the
+        file is streamed directly from the stage's storage, and is revalidated
+        using its ETag. Otherwise, the file is revalidated using the MD5 digest
+        reported by `LIST`, and is downloaded to a temporary directory that is
+        removed once the manifest has been read.
+
+        `LIST` is only queried to revalidate a version, or, if `versioned`, to
+        version a newly downloaded file.
+        """
+
+        connection = self.connection(self.registry)
         file_name = str(PurePosixPath(self.stage_path).name)
-        tmp_dir = tempfile.mkdtemp(prefix="dbt_loom_")
 
-        # Snowflake needs '/' path separators
-        tmp_dir_sf = tmp_dir.replace("\\", "/")
+        if self.presigned_url:
+            url = connection.presigned_url(self.stage, self.stage_path)
+            headers = {"If-None-Match": version} if version else {}
+            session = self.session or create_session()
+            response = session.get(url, headers=headers, stream=True)
+            if response.status_code == 304:
+                response.close()
+                return None
+            response.raise_for_status()
 
-        with adapter.connection_named("dbt-loom"):
+            response.raw.decode_content = True
+            return ManifestPayload(
+                content=None,
+                name=file_name,
+                version=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                stream=response.raw,
+            )
+
+        file_version: Optional[str] = None
+        last_modified: Optional[str] = None
+        if version is not None:
+            file_version, last_modified = connection.file_version(
+                self.stage, self.stage_path
+            )
+            if file_version == version:
+                return None
+
+        tmp_dir = tempfile.mkdtemp(prefix="dbt_loom_")
+        try:
+            # Snowflake needs '/' path separators
+            tmp_dir_sf = tmp_dir.replace("\\", "/")
             get_query = f"get @{self.stage}/{self.stage_path} file://{tmp_dir_sf}/"
-            response, table = adapter.connections.execute(get_query)
+            response, _ = connection.execute(get_query)
             if response.rows_affected == 0:
                 raise Exception(
                     f"Failed to get file {self.stage}/{self.stage_path}: {response}"
                 )
 
-        download_path = Path(tmp_dir) / file_name
+            stream = TemporaryFileReader(Path(tmp_dir) / file_name, tmp_dir)
+            if versioned and version is None:
+                file_version, last_modified = connection.file_version(
+                    self.stage, self.stage_path
+                )
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
 
-        if download_path.name.endswith(".gz"):
-            with gzip.GzipFile(download_path) as gzip_file:
-                content = gzip_file.read().decode("utf-8")
-        else:
-            with download_path.open("r") as f:
-                content = f.read()
+        return ManifestPayload(
+            content=None,
+            name=file_name,
+            version=file_version,
+            last_modified=last_modified,
+            stream=stream,
+        )
+
+    def load_manifest(self) -> Dict:
+        """Load the manifest.json file from Snowflake stage."""
+
+        # Close the connection afterwards, unless it is shared with other references.
+        owns_registry = self.registry is None
+        if owns_registry:
+            self.registry = ClientRegistry()
 
-        return json.loads(content)
+        try:
+            payload = self.fetch(versioned=False)
+            assert payload is not None
+            return decode_manifest(payload)
+        finally:
+            if owns_registry:
+                assert self.registry is not None
+                self.registry.close()
+                self.registry = None
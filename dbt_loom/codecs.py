@@ -0,0 +1,192 @@
+import gzip
+from dataclasses import dataclass
+from typing import IO, Callable, List, Optional, Tuple
+
+from dbt_loom.logging import fire_event
+
+# The size of the chunks read from a compressed stream by chunked decompressors.
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Codec:
+    """
+    A compression format that manifests may be stored in. Codecs are detected
+    by the magic number at the start of a payload, falling back to the suffix of
+    the payload's name for formats without a magic number.
+    """
+
+    name: str
+    suffixes: Tuple[str, ...]
+    magic_number: Optional[bytes]
+    decompress_stream: Callable[[IO[bytes]], IO[bytes]]
+    compress: Callable[[bytes], bytes]
+
+
+class DecompressingReader:
+    """
+    A byte stream that incrementally decompresses another stream using a
+    decompressor that only accepts chunks of data, like brotli's.
+    """
+
+    def __init__(self, stream: IO[bytes], process: Callable[[bytes], bytes]) -> None:
+        self.stream = stream
+        self.process = process
+        self.buffer = b""
+        self.offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            chunks = [self.buffer[self.offset :]]
+            for chunk in iter(lambda: self.stream.read(CHUNK_SIZE), b""):
+                chunks.append(self.process(chunk))
+            self.buffer, self.offset = b"", 0
+            return b"".join(chunks)
+
+        # Track an offset into the decompressed chunk, rather than slicing the
+        # remainder of the chunk on every read.
+        while self.offset >= len(self.buffer):
+            chunk = self.stream.read(CHUNK_SIZE)
+            if not chunk:
+                return b""
+            self.buffer, self.offset = self.process(chunk), 0
+
+        data = self.buffer[self.offset : self.offset + size]
+        self.offset += len(data)
+        return data
+
+
+def _import_zstd():
+    """Import a zstd implementation, preferring the standard library's when available."""
+    try:
+        from compression import zstd  # type: ignore
+
+        return zstd, True
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+    except ImportError:
+        fire_event(
+            msg="dbt-loom expected zstandard to be installed to decompress zstd "
+            "manifests. Install it with `pip install dbt-loom[zstd]`."
+        )
+        raise
+
+    return zstandard, False
+
+
+def decompress_zstd_stream(stream: IO[bytes]) -> IO[bytes]:
+    """Open a stream that decompresses a zstd stream as it is read."""
+    module, is_stdlib = _import_zstd()
+    if is_stdlib:
+        return module.ZstdFile(stream)
+
+    return module.ZstdDecompressor().stream_reader(stream, read_across_frames=True)
+
+
+def compress_zstd(content: bytes) -> bytes:
+    """Compress content with zstd."""
+    module, is_stdlib = _import_zstd()
+    if is_stdlib:
+        return module.compress(content)
+
+    return module.ZstdCompressor().compress(content)
+
+
+def _import_brotli():
+    """Import brotli, or the API-compatible brotlicffi."""
+    try:
+        import brotli  # type: ignore
+    except ImportError:
+        try:
+            import brotlicffi as brotli  # type: ignore
+        except ImportError:
+            fire_event(
+                msg="dbt-loom expected brotli to be installed to decompress brotli "
+                "manifests. Install it with `pip install dbt-loom[brotli]`."
+            )
+            raise
+
+    return brotli
+
+
+def decompress_brotli_stream(stream: IO[bytes]) -> IO[bytes]:
+    """Open a stream that decompresses a brotli stream as it is read."""
+    decompressor = _import_brotli().Decompressor()
+    return DecompressingReader(stream, decompressor.process)  # type: ignore
+
+
+def compress_brotli(content: bytes) -> bytes:
+    """Compress content with brotli."""
+    return _import_brotli().compress(content)
+
+
+CODECS: List[Codec] = [
+    Codec(
+        name="gzip",
+        suffixes=(".gz", ".gzip"),
+        magic_number=b"\x1f\x8b",
+        decompress_stream=lambda stream: gzip.GzipFile(fileobj=stream),  # type: ignore
+        compress=gzip.compress,
+    ),
+    Codec(
+        name="zstd",
+        suffixes=(".zst", ".zstd"),
+        magic_number=b"\x28\xb5\x2f\xfd",
+        decompress_stream=decompress_zstd_stream,
+        compress=compress_zstd,
+    ),
+    # Brotli streams do not have a magic number, so they are detected by suffix.
+    Codec(
+        name="brotli",
+        suffixes=(".br",),
+        magic_number=None,
+        decompress_stream=decompress_brotli_stream,
+        compress=compress_brotli,
+    ),
+]
+
+
+def register_codec(codec: Codec) -> None:
+    """Register an additional codec, taking precedence over existing codecs."""
+    CODECS.insert(0, codec)
+
+
+def magic_number_length() -> int:
+    """The number of bytes that must be read from a payload to detect its codec."""
+    return max(len(codec.magic_number or b"") for codec in CODECS)
+
+
+def detect_codec(prefix: bytes, name: str = "") -> Optional[Codec]:
+    """
+    Detect the codec of a payload from its first bytes, falling back to the
+    suffix of its name. Returns None if the payload is not compressed.
+    """
+
+    # Content is checked first, since some stores transparently decompress objects
+    # that were uploaded with a compressed suffix.
+    for codec in CODECS:
+        if codec.magic_number and prefix.startswith(codec.magic_number):
+            return codec
+
+    # Manifests are JSON objects, so only fall back to suffixes if the content
+    # cannot be the start of a manifest.
+    if prefix.lstrip()[:1] == b"{":
+        return None
+
+    for codec in CODECS:
+        if codec.magic_number is None and name.endswith(codec.suffixes):
+            return codec
+
+    return None
+
+
+def codec_for_suffix(name: str) -> Optional[Codec]:
+    """Get the codec for a file name based on its suffix, if any."""
+    for codec in CODECS:
+        if name.endswith(codec.suffixes):
+            return codec
+
+    return None
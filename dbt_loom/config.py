@@ -1,7 +1,7 @@
 from enum import Enum
 from pathlib import Path
 import re
-from typing import List, Union
+from typing import List, Optional, Union
 from urllib.parse import ParseResult, urlparse
 
 from pydantic import BaseModel, Field, validator
@@ -14,6 +14,9 @@ from dbt_loom.clients.s3 import S3ReferenceConfig
 from dbt_loom.clients.snowflake_stage import SnowflakeReferenceConfig
 from dbt_loom.clients.dbx import DatabricksReferenceConfig
 
+# The dbt selector methods supported by `select` and `exclude`.
+SELECTOR_METHODS = ("", "fqn", "tag")
+
 
 class ManifestReferenceType(str, Enum):
     """Type of ManifestReference"""
@@ -28,6 +31,14 @@ class ManifestReferenceType(str, Enum):
     databricks = "databricks"
 
 
+class JsonBackendType(str, Enum):
+    """Library used to parse manifest JSON"""
+
+    json = "json"
+    orjson = "orjson"
+    msgspec = "msgspec"
+
+
 class FileReferenceConfig(BaseModel):
     """Configuration for a file reference"""
 
@@ -65,14 +76,71 @@ class ManifestReference(BaseModel):
         DatabricksReferenceConfig,
     ]
     excluded_packages: List[str] = Field(default_factory=list)
+    resource_types: Optional[List[str]] = None
+    access: Optional[List[str]] = None
+    select: List[str] = Field(default_factory=list)
+    exclude: List[str] = Field(default_factory=list)
     optional: bool = False
 
+    @validator("select", "exclude", each_item=True)
+    def supported_selector(cls, v) -> str:
+        """Check that a selector uses a selector method supported by dbt-loom."""
+
+        method, _, _ = v.rpartition(":")
+        if method not in SELECTOR_METHODS:
+            raise ValueError(
+                f"dbt-loom does not support the selector method `{method}` "
+                f"used in `{v}`."
+            )
+
+        return v
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the local manifest cache"""
+
+    path: Path = Path("target") / "dbt_loom"
+    ttl: int = Field(default=0, ge=0)
+    delta: bool = False
+    snapshot: bool = False
+
+
+class TimingsConfig(BaseModel):
+    """Configuration for the dbt-loom timings artifact"""
+
+    path: Path = Path("target") / "dbt_loom_timings.json"
+
+
+class LazyLoadingConfig(BaseModel):
+    """Configuration for only loading the references that a project refs"""
+
+    projects: List[str] = Field(default_factory=list)
+    paths: Optional[List[Path]] = None
+    prune_nodes: bool = False
+
+
+class HttpConfig(BaseModel):
+    """Configuration for HTTP requests made by dbt-loom"""
+
+    connect_timeout: float = Field(default=10, gt=0)
+    read_timeout: float = Field(default=60, gt=0)
+    retries: int = Field(default=3, ge=0)
+    backoff_factor: float = Field(default=0.5, ge=0)
+
 
 class dbtLoomConfig(BaseModel):
     """Configuration for dbt Loom"""
 
     manifests: List[ManifestReference]
     enable_telemetry: bool = False
+    max_concurrency: int = Field(default=1, ge=1)
+    streaming: bool = False
+    json_backend: JsonBackendType = JsonBackendType.json
+    validate_nodes: bool = True
+    cache: Optional[CacheConfig] = None
+    timings: Optional[TimingsConfig] = None
+    http: HttpConfig = Field(default_factory=HttpConfig)
+    lazy_loading: Optional[LazyLoadingConfig] = None
 
 
 class LoomConfigurationError(BaseException):
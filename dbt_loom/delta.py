@@ -0,0 +1,120 @@
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from dbt_loom.cache import ManifestCache
+from dbt_loom.payload import SKIPPED_RESOURCE_TYPES
+
+# The raw node properties that are carried into an injected node.
+FINGERPRINT_FIELDS = (
+    "name",
+    "package_name",
+    "schema",
+    "database",
+    "relation_name",
+    "version",
+    "latest_version",
+    "deprecation_date",
+    "access",
+    "group",
+    "enabled",
+)
+
+# A mapping of unique_id to the fingerprint of the raw node and its converted node.
+DeltaNodes = Dict[str, Tuple[Hashable, Any]]
+
+
+def node_fingerprint(node: Dict) -> Hashable:
+    """
+    Fingerprint a raw manifest node. The fingerprint includes the checksum of the
+    node's file, along with every property that dbt-loom reads from the node,
+    since properties like `access` can change without changing the file.
+    """
+    config = node.get("config") or {}
+    depends_on = node.get("depends_on") or {}
+    return (
+        (node.get("checksum") or {}).get("checksum"),
+        tuple(node.get(field) for field in FINGERPRINT_FIELDS),
+        config.get("access"),
+        config.get("event_time"),
+        tuple(depends_on.get("nodes") or ()),
+    )
+
+
+def partition_nodes(
+    manifest: Dict,
+    previous: DeltaNodes,
+    node_filter: Optional[Callable[[str, Dict], bool]] = None,
+) -> Tuple[Dict[str, Dict], Dict[str, Hashable], Dict[str, Any]]:
+    """
+    Split the selected nodes of a manifest into the raw nodes that have changed
+    since the previous run, and the converted nodes that can be reused as-is.
+    Returns the changed raw nodes, the fingerprint of every selected node in
+    manifest order, and the reused converted nodes.
+    """
+
+    changed: Dict[str, Dict] = {}
+    fingerprints: Dict[str, Hashable] = {}
+    reused: Dict[str, Any] = {}
+
+    for unique_id, node in manifest["nodes"].items():
+        if unique_id.split(".")[0] in SKIPPED_RESOURCE_TYPES or not node:
+            continue
+
+        if node_filter is not None and not node_filter(unique_id, node):
+            continue
+
+        fingerprint = node_fingerprint(node)
+        fingerprints[unique_id] = fingerprint
+
+        previous_node = previous.get(unique_id)
+        if previous_node is not None and previous_node[0] == fingerprint:
+            reused[unique_id] = previous_node[1]
+        else:
+            changed[unique_id] = node
+
+    return changed, fingerprints, reused
+
+
+class DeltaStore:
+    """
+    An on-disk store of the nodes converted for each manifest reference on the
+    previous run, along with the fingerprint of the raw node they were converted
+    from. Stored nodes are discarded when the version of dbt-loom or dbt changes.
+    """
+
+    def __init__(self, path: Path, version: str) -> None:
+        self.path = path
+        self.version = version
+
+    def _delta_path(self, key: str) -> Path:
+        return self.path / "deltas" / f"{key}.pickle"
+
+    def get(self, key: str) -> DeltaNodes:
+        """Get the nodes stored for a key, or an empty mapping if none are valid."""
+        try:
+            with open(self._delta_path(key), "rb") as file:
+                version, nodes = pickle.load(file)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            ValueError,
+            TypeError,
+            # Raised if the stored nodes reference classes that no longer exist.
+            AttributeError,
+            ImportError,
+        ):
+            return {}
+
+        if version != self.version:
+            return {}
+
+        return nodes
+
+    def put(self, key: str, nodes: DeltaNodes) -> None:
+        """Store the nodes converted for a key, replacing any previous nodes."""
+        ManifestCache._write_atomic(
+            self._delta_path(key),
+            pickle.dumps((self.version, nodes), protocol=pickle.HIGHEST_PROTOCOL),
+        )
@@ -0,0 +1,87 @@
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from dbt_loom.config import ManifestReference
+
+
+class NodeFilter:
+    """
+    Filter raw manifest node dictionaries before they are validated, so that
+    dbt-loom only pays the cost of constructing nodes that will be injected.
+
+    Selectors use dbt's method syntax. `tag:<tag>` selects nodes by tag, and
+    `fqn:<pattern>` (or a bare `<pattern>`) selects nodes whose fully qualified
+    name matches a glob pattern, or is nested beneath it.
+    """
+
+    def __init__(
+        self,
+        excluded_packages: Iterable[str] = (),
+        resource_types: Optional[Iterable[str]] = None,
+        access: Optional[Iterable[str]] = None,
+        select: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+    ) -> None:
+        self.excluded_packages = frozenset(excluded_packages)
+        self.resource_types = (
+            frozenset(resource_types) if resource_types is not None else None
+        )
+        self.access = frozenset(access) if access is not None else None
+        self.select = list(select)
+        self.exclude = list(exclude)
+
+    @classmethod
+    def from_reference(cls, manifest_reference: ManifestReference) -> "NodeFilter":
+        """Create a NodeFilter based on the filters configured for a ManifestReference."""
+        return cls(
+            excluded_packages=manifest_reference.excluded_packages,
+            resource_types=manifest_reference.resource_types,
+            access=manifest_reference.access,
+            select=manifest_reference.select,
+            exclude=manifest_reference.exclude,
+        )
+
+    @staticmethod
+    def _matches(node: Dict, selector: str) -> bool:
+        """Check if a raw node matches a single selector."""
+        method, _, value = selector.rpartition(":")
+
+        if method == "tag":
+            tags: List[str] = node.get("tags") or (node.get("config") or {}).get(
+                "tags", []
+            )
+            return value in tags
+
+        fqn = ".".join(node.get("fqn") or (node["package_name"], node["name"]))
+        return fnmatchcase(fqn, value) or fnmatchcase(fqn, f"{value}.*")
+
+    def __call__(self, unique_id: str, node: Dict) -> bool:
+        """Check if a raw node should be selected for injection."""
+
+        if node.get("package_name") in self.excluded_packages:
+            return False
+
+        if (
+            self.resource_types is not None
+            and unique_id.split(".")[0] not in self.resource_types
+        ):
+            return False
+
+        if self.access is not None:
+            access = node.get("access") or (node.get("config") or {}).get(
+                "access", "protected"
+            )
+            if access not in self.access:
+                return False
+
+        if self.select and not any(
+            self._matches(node, selector) for selector in self.select
+        ):
+            return False
+
+        if self.exclude and any(
+            self._matches(node, selector) for selector in self.exclude
+        ):
+            return False
+
+        return True
@@ -0,0 +1,155 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dbt_loom.codecs import codec_for_suffix
+from dbt_loom.payload import ManifestPayload, decode_manifest
+
+LOOM_INDEX_SCHEMA_VERSION = "dbt-loom/index/v1"
+
+# Node properties that are read by dbt-loom when constructing injected nodes.
+NODE_PROPERTIES = (
+    "unique_id",
+    "name",
+    "package_name",
+    "resource_type",
+    "schema",
+    "database",
+    "relation_name",
+    "version",
+    "latest_version",
+    "deprecation_date",
+    "access",
+    "group",
+    "enabled",
+    "fqn",
+    "tags",
+)
+
+# Node config properties that are read by dbt-loom.
+CONFIG_PROPERTIES = ("access", "event_time", "tags")
+
+EXCLUDED_RESOURCE_TYPES = ("test", "macro")
+
+
+def is_loom_index(manifest: Dict) -> bool:
+    """Check if a manifest dictionary is a loom index."""
+    return (
+        manifest.get("metadata", {}).get("dbt_schema_version")
+        == LOOM_INDEX_SCHEMA_VERSION
+    )
+
+
+def reduce_node(node: Dict) -> Dict:
+    """Reduce a manifest node to the properties used by dbt-loom."""
+
+    reduced = {key: node[key] for key in NODE_PROPERTIES if node.get(key) is not None}
+
+    config = {
+        key: node["config"][key]
+        for key in CONFIG_PROPERTIES
+        if (node.get("config") or {}).get(key) is not None
+    }
+    if config:
+        reduced["config"] = config
+
+    depends_on_nodes = (node.get("depends_on") or {}).get("nodes")
+    if depends_on_nodes:
+        reduced["depends_on"] = {"nodes": depends_on_nodes}
+
+    return reduced
+
+
+def build_loom_index(manifest: Dict) -> Dict:
+    """
+    Reduce a dbt manifest dictionary into a loom index: a compact artifact that
+    contains only the node, group, and project metadata that dbt-loom needs to
+    inject upstream nodes into downstream projects.
+    """
+
+    if is_loom_index(manifest):
+        return manifest
+
+    metadata = manifest.get("metadata", {})
+
+    return {
+        "metadata": {
+            "dbt_schema_version": LOOM_INDEX_SCHEMA_VERSION,
+            "manifest_schema_version": metadata.get("dbt_schema_version"),
+            "project_name": metadata.get("project_name"),
+            "dbt_version": metadata.get("dbt_version"),
+            "generated_at": metadata.get("generated_at"),
+        },
+        "nodes": {
+            unique_id: reduce_node(node)
+            for unique_id, node in manifest.get("nodes", {}).items()
+            if unique_id.split(".")[0] not in EXCLUDED_RESOURCE_TYPES
+        },
+        "groups": {
+            unique_id: {
+                key: group[key]
+                for key in ("name", "package_name", "owner")
+                if group.get(key) is not None
+            }
+            for unique_id, group in manifest.get("groups", {}).items()
+        },
+    }
+
+
+def write_loom_index(manifest_path: Path, output_path: Path) -> Dict:
+    """Read a manifest.json file and write its loom index to `output_path`."""
+
+    with open(manifest_path, "rb") as manifest_file:
+        loom_index = build_loom_index(
+            decode_manifest(
+                ManifestPayload(
+                    content=None, name=manifest_path.name, stream=manifest_file
+                )
+            )
+        )
+
+    content = json.dumps(loom_index, separators=(",", ":")).encode("utf-8")
+    codec = codec_for_suffix(output_path.name)
+    if codec is not None:
+        content = codec.compress(content)
+
+    output_path.write_bytes(content)
+    return loom_index
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Command line entrypoint for generating a loom index from a manifest."""
+
+    parser = argparse.ArgumentParser(
+        prog="dbt-loom-index",
+        description="Reduce a dbt manifest.json into a compact dbt-loom index.",
+    )
+    parser.add_argument(
+        "manifest",
+        type=Path,
+        nargs="?",
+        default=Path("target/manifest.json"),
+        help="Path to the manifest.json file to index.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("target/loom_index.json"),
+        help=(
+            "Path to write the loom index to. Suffix with `.gz`, `.zst`, or `.br` "
+            "to compress it."
+        ),
+    )
+    parsed_args = parser.parse_args(args)
+
+    loom_index = write_loom_index(parsed_args.manifest, parsed_args.output)
+    print(
+        f"Wrote {len(loom_index['nodes'])} nodes from `{parsed_args.manifest}` "
+        f"to `{parsed_args.output}`."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,14 @@
 import datetime
-from io import BytesIO
-import json
-import gzip
+import functools
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import unquote, urlunparse
 
 from pydantic import BaseModel, Field, validator
 import requests
 
+from dbt_loom.cache import CacheEntry, ManifestCache, hash_file
 from dbt_loom.clients.snowflake_stage import SnowflakeReferenceConfig, SnowflakeClient
 
 try:
@@ -21,6 +20,7 @@ from dbt_loom.clients.az_blob import AzureClient, AzureReferenceConfig
 from dbt_loom.clients.dbt_cloud import DbtCloud, DbtCloudReferenceConfig
 from dbt_loom.clients.paradime import ParadimeClient, ParadimeReferenceConfig
 from dbt_loom.clients.gcs import GCSClient, GCSReferenceConfig
+from dbt_loom.clients.registry import ClientRegistry
 from dbt_loom.clients.s3 import S3Client, S3ReferenceConfig
 from dbt_loom.clients.dbx import DatabricksClient, DatabricksReferenceConfig
 from dbt_loom.config import (
@@ -29,6 +29,18 @@ from dbt_loom.config import (
     ManifestReference,
     ManifestReferenceType,
 )
+from dbt_loom.logging import fire_event
+from dbt_loom.payload import ManifestPayload, decode_manifest
+from dbt_loom.sessions import create_session
+from dbt_loom.timings import TimingRecorder, timed_phase
+
+
+def identify_relation_identifier(name: str, relation_name: Optional[str]) -> str:
+    """Get the identifier for a node from its relation name, falling back to its name."""
+    if not relation_name:
+        return name
+
+    return relation_name.split(".")[-1].replace('"', "").replace("`", "")
 
 
 class DependsOn(BaseModel):
@@ -80,14 +92,17 @@ class ManifestNode(BaseModel, use_enum_values=True):
 
     @property
     def identifier(self) -> str:
-        if not self.relation_name:
-            return self.name
-
-        return self.relation_name.split(".")[-1].replace('"', "").replace("`", "")
+        return identify_relation_identifier(self.name, self.relation_name)
 
     def dump(self) -> Dict:
         """Dump the ManifestNode to a Dict, with support for pydantic 1 and 2"""
-        exclude_set = {"schema_name", "depends_on", "node_config", "unique_id"}
+        exclude_set = {
+            "schema_name",
+            "depends_on",
+            "node_config",
+            "unique_id",
+            "generated_at",
+        }
         if hasattr(self, "model_dump"):
             return self.model_dump(exclude=exclude_set)  # type: ignore
 
@@ -103,36 +118,112 @@ class InvalidManifestPath(Exception):
 
 
 class ManifestLoader:
-    def __init__(self):
-        self.loading_functions = {
-            ManifestReferenceType.file: self.load_from_path,
-            ManifestReferenceType.dbt_cloud: self.load_from_dbt_cloud,
-            ManifestReferenceType.gcs: self.load_from_gcs,
-            ManifestReferenceType.s3: self.load_from_s3,
-            ManifestReferenceType.azure: self.load_from_azure,
-            ManifestReferenceType.snowflake: self.load_from_snowflake,
+    def __init__(
+        self,
+        cache: Optional[ManifestCache] = None,
+        streaming: bool = False,
+        session: Optional[requests.Session] = None,
+        clients: Optional[ClientRegistry] = None,
+        json_backend: str = "json",
+    ):
+        self.cache = cache
+        self.streaming = streaming
+        self.json_backend = json_backend
+        # A single session is shared by every HTTP-based reference, so that
+        # connections to the same host are pooled and kept alive between requests.
+        self.session = session or create_session()
+        # Object store clients are likewise shared by references to the same
+        # account, project, or credentials.
+        self.clients = clients or ClientRegistry()
+        self.loading_functions: Dict[ManifestReferenceType, Callable[..., Dict]] = {
+            ManifestReferenceType.file: functools.partial(
+                self.load_from_path,
+                streaming=streaming,
+                session=self.session,
+                json_backend=json_backend,
+            ),
+            ManifestReferenceType.dbt_cloud: functools.partial(
+                self.load_from_dbt_cloud, session=self.session
+            ),
+            ManifestReferenceType.gcs: functools.partial(
+                self.load_from_gcs, clients=self.clients
+            ),
+            ManifestReferenceType.s3: functools.partial(
+                self.load_from_s3, clients=self.clients
+            ),
+            ManifestReferenceType.azure: functools.partial(
+                self.load_from_azure, clients=self.clients
+            ),
+            ManifestReferenceType.snowflake: functools.partial(
+                self.load_from_snowflake, clients=self.clients, session=self.session
+            ),
             ManifestReferenceType.paradime: self.load_from_paradime,
-            ManifestReferenceType.databricks: self.load_from_databricks,
+            ManifestReferenceType.databricks: functools.partial(
+                self.load_from_databricks, clients=self.clients
+            ),
+        }
+        self.fetching_functions: Dict[
+            ManifestReferenceType, Callable[..., Optional[ManifestPayload]]
+        ] = {
+            ManifestReferenceType.file: functools.partial(
+                self.fetch_from_http, session=self.session
+            ),
+            ManifestReferenceType.dbt_cloud: functools.partial(
+                self.fetch_from_dbt_cloud, session=self.session
+            ),
+            ManifestReferenceType.gcs: functools.partial(
+                self.fetch_from_gcs, clients=self.clients
+            ),
+            ManifestReferenceType.s3: functools.partial(
+                self.fetch_from_s3, clients=self.clients
+            ),
+            ManifestReferenceType.azure: functools.partial(
+                self.fetch_from_azure, clients=self.clients
+            ),
+            ManifestReferenceType.snowflake: functools.partial(
+                self.fetch_from_snowflake,
+                clients=self.clients,
+                session=self.session,
+                # Only cached manifests are revalidated, so need a version.
+                versioned=self.cache is not None,
+            ),
+            ManifestReferenceType.databricks: functools.partial(
+                self.fetch_from_databricks, clients=self.clients
+            ),
         }
 
     @staticmethod
-    def load_from_path(config: FileReferenceConfig) -> Dict:
+    def load_from_path(
+        config: FileReferenceConfig,
+        streaming: bool = False,
+        timings: Optional[TimingRecorder] = None,
+        session: Optional[requests.Session] = None,
+        json_backend: str = "json",
+    ) -> Dict:
         """
         Load a manifest dictionary based on a FileReferenceConfig. This config's
         path can point to either a local file or a URL to a remote location.
         """
 
         if config.path.scheme in ("http", "https"):
-            return ManifestLoader.load_from_http(config)
+            return ManifestLoader.load_from_http(
+                config,
+                streaming=streaming,
+                timings=timings,
+                session=session,
+                json_backend=json_backend,
+            )
 
         if config.path.scheme in ("file"):
-            return ManifestLoader.load_from_local_filesystem(config)
+            return ManifestLoader.load_from_local_filesystem(
+                config, streaming=streaming, timings=timings, json_backend=json_backend
+            )
 
         raise UnknownManifestPathType()
 
     @staticmethod
-    def load_from_local_filesystem(config: FileReferenceConfig) -> Dict:
-        """Load a manifest dictionary from a local file"""
+    def local_file_path(config: FileReferenceConfig) -> Path:
+        """Get the path of a manifest stored on the local filesystem."""
 
         if not config.path.path:
             raise InvalidManifestPath()
@@ -151,44 +242,116 @@ class ManifestLoader:
         if not file_path.exists():
             raise LoomConfigurationError(f"The path `{file_path}` does not exist.")
 
-        if file_path.suffix == ".gz":
-            with gzip.open(file_path, "rt") as file:
-                return json.load(file)
-
-        return json.load(open(file_path))
+        return file_path
 
     @staticmethod
-    def load_from_http(config: FileReferenceConfig) -> Dict:
+    def load_from_local_filesystem(
+        config: FileReferenceConfig,
+        streaming: bool = False,
+        timings: Optional[TimingRecorder] = None,
+        json_backend: str = "json",
+    ) -> Dict:
         """Load a manifest dictionary from a local file"""
 
+        file_path = ManifestLoader.local_file_path(config)
+
+        with open(file_path, "rb") as file:
+            return decode_manifest(
+                ManifestPayload(content=None, name=file_path.name, stream=file),
+                streaming=streaming,
+                timings=timings,
+                json_backend=json_backend,
+            )
+
+    @staticmethod
+    def load_from_http(
+        config: FileReferenceConfig,
+        streaming: bool = False,
+        timings: Optional[TimingRecorder] = None,
+        session: Optional[requests.Session] = None,
+        json_backend: str = "json",
+    ) -> Dict:
+        """Load a manifest dictionary from a remote location via HTTP(S)"""
+
+        with timed_phase(timings, "fetch"):
+            payload = ManifestLoader.fetch_from_http(config, session=session)
+            assert payload is not None
+
+        return decode_manifest(
+            payload, streaming=streaming, timings=timings, json_backend=json_backend
+        )
+
+    @staticmethod
+    def fetch_from_http(
+        config: FileReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ) -> Optional[ManifestPayload]:
+        """
+        Fetch a raw manifest via HTTP(S), revalidating it with conditional request
+        headers. Returns None if the remote manifest has not been modified.
+        """
+
         if not config.path.path:
             raise InvalidManifestPath()
 
-        response = requests.get(urlunparse(config.path), stream=True)
+        headers = {}
+        if version:
+            headers["If-None-Match"] = version
+        elif last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        session = session or create_session()
+        response = session.get(urlunparse(config.path), headers=headers, stream=True)
+        if response.status_code == 304:
+            response.close()
+            return None
         response.raise_for_status()  # Check for request errors
 
-        # Check for compression on the file. If compressed, store it in a buffer
-        # and decompress it.
-        if (
-            config.path.path.endswith(".gz")
-            or response.headers.get("Content-Encoding") == "gzip"
-        ):
-            with gzip.GzipFile(fileobj=BytesIO(response.content)) as gz_file:
-                return json.load(gz_file)
-
-        return response.json()
+        # Stream the body, while still honoring any Content-Encoding of the response.
+        response.raw.decode_content = True
+        return ManifestPayload(
+            content=None,
+            name=config.path.path,
+            version=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            stream=response.raw,
+        )
 
     @staticmethod
-    def load_from_dbt_cloud(config: DbtCloudReferenceConfig) -> Dict:
+    def load_from_dbt_cloud(
+        config: DbtCloudReferenceConfig, session: Optional[requests.Session] = None
+    ) -> Dict:
         """Load a manifest dictionary from dbt Cloud."""
         client = DbtCloud(
-            account_id=config.account_id, api_endpoint=config.api_endpoint
+            account_id=config.account_id,
+            api_endpoint=config.api_endpoint,
+            session=session,
         )
 
         return client.get_models(config.job_id, step=config.step)
 
     @staticmethod
-    def load_from_gcs(config: GCSReferenceConfig) -> Dict:
+    def fetch_from_dbt_cloud(
+        config: DbtCloudReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ) -> Optional[ManifestPayload]:
+        """Fetch a raw manifest from dbt Cloud, unless the latest run is unchanged."""
+        client = DbtCloud(
+            account_id=config.account_id,
+            api_endpoint=config.api_endpoint,
+            session=session,
+        )
+
+        return client.fetch(config.job_id, step=config.step, version=version)
+
+    @staticmethod
+    def load_from_gcs(
+        config: GCSReferenceConfig, clients: Optional[ClientRegistry] = None
+    ) -> Dict:
         """Load a manifest dictionary from a GCS bucket."""
         gcs_client = GCSClient(
             project_id=config.project_id,
@@ -196,40 +359,129 @@ class ManifestLoader:
             object_name=config.object_name,
             credentials=config.credentials,
             impersonate_service_account=config.impersonate_service_account,
+            generation=config.generation,
+            registry=clients,
         )
 
         return gcs_client.load_manifest()
 
     @staticmethod
-    def load_from_s3(config: S3ReferenceConfig) -> Dict:
+    def fetch_from_gcs(
+        config: GCSReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+    ) -> Optional[ManifestPayload]:
+        """Fetch a raw manifest from a GCS bucket, unless its generation is unchanged."""
+        gcs_client = GCSClient(
+            project_id=config.project_id,
+            bucket_name=config.bucket_name,
+            object_name=config.object_name,
+            credentials=config.credentials,
+            impersonate_service_account=config.impersonate_service_account,
+            generation=config.generation,
+            registry=clients,
+        )
+
+        return gcs_client.fetch(version=version)
+
+    @staticmethod
+    def load_from_s3(
+        config: S3ReferenceConfig, clients: Optional[ClientRegistry] = None
+    ) -> Dict:
         """Load a manifest dictionary from an S3-compatible bucket."""
         gcs_client = S3Client(
             bucket_name=config.bucket_name,
             object_name=config.object_name,
+            registry=clients,
         )
 
         return gcs_client.load_manifest()
 
     @staticmethod
-    def load_from_azure(config: AzureReferenceConfig) -> Dict:
+    def fetch_from_s3(
+        config: S3ReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+    ) -> Optional[ManifestPayload]:
+        """Fetch a raw manifest from an S3-compatible bucket, unless its ETag is unchanged."""
+        s3_client = S3Client(
+            bucket_name=config.bucket_name,
+            object_name=config.object_name,
+            registry=clients,
+        )
+
+        return s3_client.fetch(version=version)
+
+    @staticmethod
+    def load_from_azure(
+        config: AzureReferenceConfig, clients: Optional[ClientRegistry] = None
+    ) -> Dict:
         """Load a manifest dictionary from Azure storage."""
         azure_client = AzureClient(
             container_name=config.container_name,
             object_name=config.object_name,
             account_name=config.account_name,
+            registry=clients,
         )
 
         return azure_client.load_manifest()
 
     @staticmethod
-    def load_from_snowflake(config: SnowflakeReferenceConfig) -> Dict:
+    def fetch_from_azure(
+        config: AzureReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+    ) -> Optional[ManifestPayload]:
+        """Fetch a raw manifest from Azure storage, unless its ETag is unchanged."""
+        azure_client = AzureClient(
+            container_name=config.container_name,
+            object_name=config.object_name,
+            account_name=config.account_name,
+            registry=clients,
+        )
+
+        return azure_client.fetch(version=version)
+
+    @staticmethod
+    def load_from_snowflake(
+        config: SnowflakeReferenceConfig,
+        clients: Optional[ClientRegistry] = None,
+        session: Optional[requests.Session] = None,
+    ) -> Dict:
         """Load a manifest dictionary from Snowflake stage."""
         snowflake_client = SnowflakeClient(
-            stage=config.stage, stage_path=config.stage_path
+            stage=config.stage,
+            stage_path=config.stage_path,
+            presigned_url=config.presigned_url,
+            registry=clients,
+            session=session,
         )
 
         return snowflake_client.load_manifest()
 
+    @staticmethod
+    def fetch_from_snowflake(
+        config: SnowflakeReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+        session: Optional[requests.Session] = None,
+        versioned: bool = True,
+    ) -> Optional[ManifestPayload]:
+        """Fetch a raw manifest from Snowflake stage over a shared connection."""
+        snowflake_client = SnowflakeClient(
+            stage=config.stage,
+            stage_path=config.stage_path,
+            presigned_url=config.presigned_url,
+            registry=clients,
+            session=session,
+        )
+
+        return snowflake_client.fetch(version=version, versioned=versioned)
+
     @staticmethod
     def load_from_paradime(config: ParadimeReferenceConfig) -> Dict:
         """Load a manifest dictionary from Paradime."""
@@ -243,12 +495,203 @@ class ManifestLoader:
         return paradime_client.load_manifest()
 
     @staticmethod
-    def load_from_databricks(config: DatabricksReferenceConfig) -> Dict:
+    def load_from_databricks(
+        config: DatabricksReferenceConfig, clients: Optional[ClientRegistry] = None
+    ) -> Dict:
         """Load a manifest dictionary from Databricks."""
-        databricks_client = DatabricksClient(path=config.path)
+        databricks_client = DatabricksClient(path=config.path, registry=clients)
         return databricks_client.load_manifest()
 
-    def load(self, manifest_reference: ManifestReference) -> Optional[Dict]:
+    @staticmethod
+    def fetch_from_databricks(
+        config: DatabricksReferenceConfig,
+        version: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+    ) -> Optional[ManifestPayload]:
+        """Fetch a raw manifest from Databricks."""
+        databricks_client = DatabricksClient(path=config.path, registry=clients)
+        return databricks_client.fetch(version=version)
+
+    def prepare(self, manifest_references: List[ManifestReference]) -> None:
+        """
+        Prepare to load several manifest references, batching any requests that
+        can be shared between them, like generating Snowflake presigned URLs.
+        """
+
+        snowflake_configs = [
+            reference.config
+            for reference in manifest_references
+            if isinstance(reference.config, SnowflakeReferenceConfig)
+            and reference.config.presigned_url
+        ]
+        if len(snowflake_configs) < 2:
+            return
+
+        SnowflakeClient.prefetch(
+            [
+                SnowflakeClient(
+                    stage=config.stage,
+                    stage_path=config.stage_path,
+                    presigned_url=config.presigned_url,
+                )
+                for config in snowflake_configs
+            ],
+            registry=self.clients,
+        )
+
+    def close(self) -> None:
+        """Close the shared HTTP session and clients, releasing pooled connections."""
+        self.session.close()
+        self.clients.close()
+
+    def is_fetchable(self, manifest_reference: ManifestReference) -> bool:
+        """
+        Check if a manifest reference can be fetched as a raw payload, allowing it
+        to be cached and decoded by dbt-loom.
+        """
+        if manifest_reference.type not in self.fetching_functions:
+            return False
+
+        if isinstance(manifest_reference.config, FileReferenceConfig):
+            return manifest_reference.config.path.scheme in ("http", "https")
+
+        return True
+
+    def load_payload(
+        self,
+        manifest_reference: ManifestReference,
+        timings: Optional[TimingRecorder] = None,
+    ) -> Dict:
+        """Fetch and decode the raw payload for a manifest reference."""
+
+        if self.cache is not None:
+            return self.load_with_cache(manifest_reference, timings=timings)
+
+        with timed_phase(timings, "fetch"):
+            payload = self.fetching_functions[manifest_reference.type](
+                manifest_reference.config
+            )
+            assert payload is not None
+
+        return decode_manifest(
+            payload,
+            streaming=self.streaming,
+            timings=timings,
+            json_backend=self.json_backend,
+        )
+
+    def load_with_cache(
+        self,
+        manifest_reference: ManifestReference,
+        timings: Optional[TimingRecorder] = None,
+    ) -> Dict:
+        """
+        Load a manifest dictionary via the local cache. Cached manifests are used
+        as-is within the cache TTL, and are otherwise revalidated against the
+        remote manifest using conditional requests.
+        """
+        entry = self.cache_entry(manifest_reference, timings=timings)
+        return self.read_cache(entry, timings=timings)
+
+    def cache_entry(
+        self,
+        manifest_reference: ManifestReference,
+        timings: Optional[TimingRecorder] = None,
+    ) -> CacheEntry:
+        """
+        Get the cache entry holding the current manifest for a reference, fetching
+        or revalidating the manifest as needed, without decoding it.
+        """
+        assert self.cache is not None
+
+        key = self.cache.key(
+            f"{manifest_reference.type.value}:{manifest_reference.config!r}"
+        )
+        entry = self.cache.get(key)
+
+        if entry is not None and self.cache.is_fresh(entry):
+            fire_event(
+                msg=f"dbt-loom: Using cached manifest for `{manifest_reference.name}`"
+            )
+            return entry
+
+        with timed_phase(timings, "fetch"):
+            payload = self.fetching_functions[manifest_reference.type](
+                manifest_reference.config,
+                version=entry.version if entry else None,
+                last_modified=entry.last_modified if entry else None,
+            )
+
+        if payload is None:
+            assert entry is not None
+            fire_event(
+                msg=f"dbt-loom: Manifest for `{manifest_reference.name}` is unchanged. "
+                "Using cached manifest."
+            )
+            return self.cache.touch(key, entry)
+
+        # Stream the payload into the cache, so that it can be decoded from disk.
+        with timed_phase(timings, "store") as timing:
+            entry = self.cache.put(key, payload)
+            timing.bytes = entry.size
+
+        return entry
+
+    def read_cache(
+        self, entry: CacheEntry, timings: Optional[TimingRecorder] = None
+    ) -> Dict:
+        """Read and decode a cached manifest payload."""
+        assert self.cache is not None
+        return decode_manifest(
+            self.cache.read(entry),
+            streaming=self.streaming,
+            timings=timings,
+            json_backend=self.json_backend,
+        )
+
+    def identify(
+        self,
+        manifest_reference: ManifestReference,
+        timings: Optional[TimingRecorder] = None,
+    ) -> Optional[Tuple[str, Callable[[], Optional[Dict]]]]:
+        """
+        Identify the current contents of a manifest reference without decoding
+        them. Returns the SHA-256 hash of the manifest, along with a function that
+        loads it, or None if the manifest cannot be identified before loading it.
+        Cached references are identified by their cache entry, and local files by
+        hashing the file.
+        """
+
+        try:
+            if self.cache is not None and self.is_fetchable(manifest_reference):
+                entry = self.cache_entry(manifest_reference, timings=timings)
+                return entry.content_hash, functools.partial(
+                    self.read_cache, entry, timings=timings
+                )
+
+            if (
+                isinstance(manifest_reference.config, FileReferenceConfig)
+                and manifest_reference.config.path.scheme == "file"
+            ):
+                file_path = self.local_file_path(manifest_reference.config)
+                with timed_phase(timings, "hash") as timing:
+                    content_hash = hash_file(file_path)
+                    timing.bytes = file_path.stat().st_size
+                return content_hash, functools.partial(
+                    self.load, manifest_reference, timings=timings
+                )
+        except LoomConfigurationError:
+            # Let `load` handle misconfigured references, including optional ones.
+            return None
+
+        return None
+
+    def load(
+        self,
+        manifest_reference: ManifestReference,
+        timings: Optional[TimingRecorder] = None,
+    ) -> Optional[Dict]:
         """Load a manifest dictionary based on a ManifestReference input."""
 
         if manifest_reference.type not in self.loading_functions:
@@ -258,9 +701,18 @@ class ManifestLoader:
             )
 
         try:
-            manifest = self.loading_functions[manifest_reference.type](
-                manifest_reference.config
-            )
+            if self.is_fetchable(manifest_reference):
+                manifest = self.load_payload(manifest_reference, timings=timings)
+            elif manifest_reference.type == ManifestReferenceType.file:
+                manifest = self.loading_functions[manifest_reference.type](
+                    manifest_reference.config, timings=timings
+                )
+            else:
+                # Other loaders fetch and parse manifests in a single step.
+                with timed_phase(timings, "load"):
+                    manifest = self.loading_functions[manifest_reference.type](
+                        manifest_reference.config
+                    )
         except LoomConfigurationError as e:
             if getattr(manifest_reference, "optional", False):
                 return None
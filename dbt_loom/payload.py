@@ -0,0 +1,274 @@
+import json
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+)
+
+from dbt_loom.codecs import detect_codec, magic_number_length
+from dbt_loom.logging import fire_event
+from dbt_loom.timings import MeasuredReader, TimingRecorder
+
+# Resource types that are never injected, and therefore never materialized when
+# parsing a manifest in streaming mode.
+SKIPPED_RESOURCE_TYPES = ("test", "macro")
+
+
+class JsonBackend(NamedTuple):
+    """A JSON decoder that operates on bytes, and the error it raises for invalid JSON."""
+
+    loads: Callable[[bytes], Any]
+    decode_error: Type[Exception]
+
+
+def _json_backends() -> Dict[str, JsonBackend]:
+    """
+    Collect the installed JSON decoders. Each decoder operates directly on bytes,
+    which avoids decoding manifests into a str first.
+    """
+
+    backends = {"json": JsonBackend(json.loads, json.JSONDecodeError)}
+
+    try:
+        import orjson
+
+        backends["orjson"] = JsonBackend(orjson.loads, orjson.JSONDecodeError)
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        backends["msgspec"] = JsonBackend(msgspec.json.decode, msgspec.DecodeError)
+    except ImportError:
+        pass
+
+    return backends
+
+
+JSON_BACKENDS = _json_backends()
+
+
+def loads_json(content: bytes, json_backend: str = "json") -> Any:
+    """
+    Deserialize JSON bytes using a JSON backend. The standard library is used by
+    default, since faster backends can use several times more memory on large
+    manifests.
+    """
+
+    if json_backend == "json":
+        return json.loads(content)
+
+    backend = JSON_BACKENDS.get(json_backend)
+    if backend is None:
+        fire_event(
+            msg=f"dbt-loom expected {json_backend} to be installed to parse "
+            f"manifests. Install it with `pip install dbt-loom[{json_backend}]`."
+        )
+        raise ImportError(f"The JSON backend `{json_backend}` is not installed.")
+
+    try:
+        return backend.loads(content)
+    except backend.decode_error:
+        # Faster backends are stricter than the standard library, and reject
+        # documents with values like NaN, so fall back before giving up.
+        return json.loads(content)
+
+
+class ByteStream(Protocol):
+    """
+    A readable byte stream, like a file or an HTTP response body. Payload streams
+    only need to support reads.
+    """
+
+    def read(self, size: int = -1, /) -> bytes: ...
+
+
+@dataclass
+class ManifestPayload:
+    """
+    The raw, undecoded contents of a manifest fetched from a remote location,
+    along with the metadata required to revalidate it later. Contents are either
+    held in memory as `content`, or provided as a `stream` that can be read once.
+    """
+
+    content: Optional[bytes]
+    name: str
+    version: Optional[str] = None
+    last_modified: Optional[str] = None
+    stream: Optional[ByteStream] = None
+
+    def open(self) -> ByteStream:
+        """Open the contents of the payload as a byte stream."""
+        if self.content is not None:
+            return BytesIO(self.content)
+
+        assert self.stream is not None, "A payload requires content or a stream."
+        return self.stream
+
+    def close(self) -> None:
+        """Close the payload's stream, releasing any underlying connection."""
+        close = getattr(self.stream, "close", None)
+        if close is not None:
+            close()
+
+
+class PrefixedReader:
+    """
+    A byte stream that yields a prefix that has already been read from a stream,
+    followed by the remainder of the stream. This allows content to be sniffed
+    from streams that do not support seeking or peeking.
+    """
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        self.prefix = prefix
+        self.stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data, self.prefix = self.prefix + self.stream.read(), b""
+            return data
+
+        if self.prefix:
+            data, self.prefix = self.prefix[:size], self.prefix[size:]
+            return data
+
+        return self.stream.read(size)
+
+
+def _build_value(
+    events: Iterator[Tuple[str, str, Any]], event: str, value: Any, builder: Any
+) -> Any:
+    """Build a python object from ijson events, starting at a start_map/start_array event."""
+    builder.event(event, value)
+
+    depth = 1
+    for _, event, value in events:
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+
+        builder.event(event, value)
+        if depth == 0:
+            break
+
+    return builder.value
+
+
+def _skip_value(events: Iterator[Tuple[str, str, Any]]) -> None:
+    """Consume ijson events for a container without materializing it."""
+    depth = 1
+    for _, event, _ in events:
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+
+        if depth == 0:
+            return
+
+
+def stream_manifest(stream: IO[bytes]) -> Dict:
+    """
+    Incrementally parse a manifest from a byte stream, materializing only the
+    manifest `metadata` and the `nodes` that may be injected by dbt-loom.
+    """
+
+    try:
+        import ijson
+    except ImportError:
+        fire_event(
+            msg="dbt-loom expected ijson to be installed for streaming. Install it "
+            "with `pip install dbt-loom[streaming]`."
+        )
+        raise
+
+    manifest: Dict[str, Dict] = {"metadata": {}, "nodes": {}}
+    events = iter(ijson.parse(stream, use_float=True))
+
+    for prefix, event, value in events:
+        if prefix == "metadata" and event == "start_map":
+            manifest["metadata"] = _build_value(
+                events, event, value, ijson.ObjectBuilder()
+            )
+
+        elif prefix == "nodes" and event == "map_key":
+            _, node_event, node_value = next(events)
+            if node_event != "start_map":
+                continue
+
+            if value.split(".")[0] in SKIPPED_RESOURCE_TYPES:
+                _skip_value(events)
+                continue
+
+            manifest["nodes"][value] = _build_value(
+                events, node_event, node_value, ijson.ObjectBuilder()
+            )
+
+    return manifest
+
+
+def parse_manifest(
+    stream: IO[bytes], streaming: bool = False, json_backend: str = "json"
+) -> Dict:
+    """Parse a manifest from a byte stream, optionally in streaming mode."""
+
+    if streaming:
+        return stream_manifest(stream)
+
+    return loads_json(stream.read(), json_backend=json_backend)
+
+
+def decode_manifest(
+    payload: ManifestPayload,
+    streaming: bool = False,
+    timings: Optional[TimingRecorder] = None,
+    json_backend: str = "json",
+) -> Dict:
+    """
+    Decompress (if needed) and deserialize the contents of a ManifestPayload.
+    Streamed payloads are decompressed and parsed as they are read, so neither the
+    compressed nor the decompressed contents are buffered in full. The payload's
+    stream is closed once it has been decoded.
+    """
+
+    source = MeasuredReader(payload.open())
+    try:
+        prefix = source.read(magic_number_length())
+        stream: IO[bytes] = PrefixedReader(prefix, source)  # type: ignore
+        codec = detect_codec(prefix, payload.name)
+        if codec is not None:
+            stream = codec.decompress_stream(stream)
+
+        reader = MeasuredReader(stream)
+        start = time.perf_counter()
+        manifest = parse_manifest(
+            reader,  # type: ignore
+            streaming=streaming,
+            json_backend=json_backend,
+        )
+        seconds = time.perf_counter() - start
+    finally:
+        payload.close()
+
+    if timings is not None:
+        # Reads are nested, so attribute the time spent in each layer separately.
+        timings.record("read", source.seconds, bytes=source.bytes)
+        if codec is not None:
+            timings.record(
+                "decompress", reader.seconds - source.seconds, bytes=reader.bytes
+            )
+        timings.record("parse", seconds - reader.seconds, bytes=reader.bytes)
+
+    return manifest
@@ -0,0 +1,66 @@
+import os
+import re
+from pathlib import Path
+from typing import Iterable, List, Set, Tuple
+
+import yaml
+
+# Two-argument refs, like `ref('project', 'model')`, which reference another project.
+CROSS_PROJECT_REF_PATTERN = re.compile(
+    r"""\bref\(\s*['"]([^'"]+)['"]\s*,\s*['"]([^'"]+)['"]""", re.MULTILINE
+)
+
+# The project paths that may contain refs, and their default values. Seed paths
+# are included since the YAML properties of seeds may contain refs in tests.
+PROJECT_PATH_KEYS = {
+    "model-paths": ["models"],
+    "seed-paths": ["seeds"],
+    "snapshot-paths": ["snapshots"],
+    "analysis-paths": ["analyses"],
+    "test-paths": ["tests"],
+    "macro-paths": ["macros"],
+}
+
+SCANNED_SUFFIXES = (".sql", ".py", ".yml", ".yaml")
+
+
+def project_paths(project_dir: Path) -> List[Path]:
+    """Get the directories of a dbt project that may contain refs to other projects."""
+
+    try:
+        with open(project_dir / "dbt_project.yml") as file:
+            project = yaml.safe_load(file) or {}
+    except (OSError, yaml.YAMLError):
+        project = {}
+
+    return [
+        project_dir / path
+        for key, default in PROJECT_PATH_KEYS.items()
+        for path in project.get(key) or default
+    ]
+
+
+def find_cross_project_refs(paths: Iterable[Path]) -> Set[Tuple[str, str]]:
+    """
+    Find the `(project, model)` pairs referenced by two-argument refs in the files
+    beneath `paths`. Files are scanned as text, without rendering any Jinja, so
+    refs whose arguments are computed at runtime are not found.
+    """
+
+    refs: Set[Tuple[str, str]] = set()
+
+    for path in paths:
+        for root, _, file_names in os.walk(path):
+            for file_name in file_names:
+                if not file_name.endswith(SCANNED_SUFFIXES):
+                    continue
+
+                try:
+                    content = Path(root, file_name).read_text(errors="ignore")
+                except OSError:
+                    continue
+
+                if "ref" in content:
+                    refs.update(CROSS_PROJECT_REF_PATTERN.findall(content))
+
+    return refs
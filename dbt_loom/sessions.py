@@ -0,0 +1,58 @@
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transient responses that are safe to retry for idempotent requests.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class LoomSession(requests.Session):
+    """
+    A requests Session that applies a default timeout to every request. Connections
+    are kept alive and pooled, so that requests to the same host share a connection.
+    """
+
+    def __init__(self, timeout: Optional[Tuple[float, float]] = None) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs) -> requests.Response:  # type: ignore
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(
+    connect_timeout: float = 10,
+    read_timeout: float = 60,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    pool_maxsize: int = 10,
+) -> LoomSession:
+    """
+    Create a session for fetching manifests over HTTP(S). Idempotent requests that
+    fail to connect, or that receive a transient error response, are retried with
+    exponential backoff.
+    """
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(("GET", "HEAD")),
+        respect_retry_after_header=True,
+        # Return the last response, so that callers can raise for its status.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+    )
+
+    session = LoomSession(timeout=(connect_timeout, read_timeout))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
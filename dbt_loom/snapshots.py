@@ -0,0 +1,90 @@
+import json
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dbt_loom.cache import ManifestCache
+from dbt_loom.config import ManifestReference
+
+
+@dataclass
+class Snapshot:
+    """The nodes converted from a single manifest, along with its metadata."""
+
+    key: str
+    metadata: Dict
+    node_count: int
+    nodes: Dict[str, Any]
+
+
+class SnapshotStore:
+    """
+    An on-disk store of the nodes converted for each manifest reference. Each
+    snapshot is keyed by the contents of the manifest it was converted from, the
+    versions of dbt-loom and dbt, the reference's node filters, and whether nodes
+    are validated, so that an unchanged manifest can be injected without parsing
+    or converting it again. Only the latest snapshot is kept for each reference.
+    """
+
+    def __init__(self, path: Path, version: str) -> None:
+        self.path = path
+        self.version = version
+
+    def _snapshot_path(self, reference_key: str) -> Path:
+        return self.path / "snapshots" / f"{reference_key}.pickle"
+
+    def key(
+        self,
+        content_hash: str,
+        manifest_reference: ManifestReference,
+        validate_nodes: bool = True,
+    ) -> str:
+        """
+        Generate the key of a snapshot of a manifest reference. Besides the
+        manifest and the reference's filters, the key includes every setting that
+        affects how nodes are converted, like whether they are validated.
+        """
+        return ManifestCache.key(
+            json.dumps(
+                [
+                    content_hash,
+                    self.version,
+                    validate_nodes,
+                    sorted(manifest_reference.excluded_packages),
+                    manifest_reference.resource_types,
+                    manifest_reference.access,
+                    manifest_reference.select,
+                    manifest_reference.exclude,
+                ]
+            )
+        )
+
+    def get(self, reference_key: str, key: str) -> Optional[Snapshot]:
+        """Get the snapshot stored for a reference, if it matches `key`."""
+        try:
+            with open(self._snapshot_path(reference_key), "rb") as file:
+                snapshot = pickle.load(file)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            ValueError,
+            TypeError,
+            # Raised if the snapshot references classes that no longer exist.
+            AttributeError,
+            ImportError,
+        ):
+            return None
+
+        if not isinstance(snapshot, Snapshot) or snapshot.key != key:
+            return None
+
+        return snapshot
+
+    def put(self, reference_key: str, snapshot: Snapshot) -> None:
+        """Store the snapshot of a reference, replacing any previous snapshot."""
+        ManifestCache._write_atomic(
+            self._snapshot_path(reference_key),
+            pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL),
+        )
@@ -0,0 +1,129 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from dbt_loom.payload import ByteStream
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore
+
+
+def max_rss() -> Optional[int]:
+    """Get the peak resident set size of the process in bytes, if available."""
+    if resource is None:
+        return None
+
+    # ru_maxrss is reported in kilobytes on Linux, and in bytes on macOS.
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@dataclass
+class PhaseTiming:
+    """The duration and size of a single phase of loading a manifest reference."""
+
+    phase: str
+    seconds: float = 0.0
+    bytes: Optional[int] = None
+    nodes: Optional[int] = None
+    max_rss: Optional[int] = None
+
+    def describe(self) -> str:
+        """Describe the phase for log output."""
+        description = f"{self.phase} {self.seconds:.3f}s"
+        if self.bytes is not None:
+            description += f" {self.bytes / 2**20:.1f} MiB"
+        if self.nodes is not None:
+            description += f" {self.nodes} nodes"
+        return description
+
+
+class TimingRecorder:
+    """Record the phases of loading a single manifest reference."""
+
+    def __init__(self, name: str, type: str) -> None:
+        self.name = name
+        self.type = type
+        self.phases: List[PhaseTiming] = []
+
+    @property
+    def seconds(self) -> float:
+        """The total time spent across all recorded phases."""
+        return sum(timing.seconds for timing in self.phases)
+
+    def record(self, phase: str, seconds: float, **kwargs) -> PhaseTiming:
+        """Record a phase that was measured elsewhere."""
+        timing = PhaseTiming(phase=phase, seconds=seconds, max_rss=max_rss(), **kwargs)
+        self.phases.append(timing)
+        return timing
+
+    def describe(self) -> str:
+        """Describe the recorded phases for log output."""
+        phases = ", ".join(timing.describe() for timing in self.phases)
+        return f"`{self.name}` in {self.seconds:.3f}s ({phases})"
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "seconds": self.seconds,
+            "phases": [asdict(timing) for timing in self.phases],
+        }
+
+
+@contextmanager
+def timed_phase(timings: Optional[TimingRecorder], phase: str) -> Iterator[PhaseTiming]:
+    """
+    Time the body of a `with` block as a phase of a TimingRecorder. The yielded
+    PhaseTiming can be used to record byte and node counts. Nothing is recorded
+    if `timings` is None.
+    """
+
+    timing = PhaseTiming(phase=phase)
+    start = time.perf_counter()
+    yield timing
+    timing.seconds = time.perf_counter() - start
+    timing.max_rss = max_rss()
+
+    if timings is not None:
+        timings.phases.append(timing)
+
+
+class MeasuredReader:
+    """Wrap a byte stream to count the bytes read from it, and the time spent reading."""
+
+    def __init__(self, stream: "ByteStream") -> None:
+        self.stream = stream
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def read(self, size: int = -1) -> bytes:
+        start = time.perf_counter()
+        data = (
+            self.stream.read() if size is None or size < 0 else self.stream.read(size)
+        )
+        self.seconds += time.perf_counter() - start
+        self.bytes += len(data)
+        return data
+
+
+def write_timings(path: Path, timings: List[TimingRecorder], **metadata) -> None:
+    """Write the recorded timings of each manifest reference to a JSON artifact."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(
+            {
+                **metadata,
+                "references": [recorder.to_dict() for recorder in timings],
+            },
+            file,
+            indent=2,
+        )
@@ -0,0 +1,159 @@
+import random
+from typing import Dict, List
+
+
+def generate_node(
+    generator: random.Random,
+    resource_type: str,
+    package_name: str,
+    name: str,
+    groups: List[str],
+    upstream: List[str],
+) -> Dict:
+    """Generate a manifest node with properties sized like a real dbt project."""
+
+    unique_id = f"{resource_type}.{package_name}.{name}"
+    columns = {
+        f"column_{index}": {
+            "name": f"column_{index}",
+            "description": f"Column {index} of {name}.",
+            "meta": {},
+            "data_type": "varchar",
+            "tags": [],
+        }
+        for index in range(generator.randint(3, 20))
+    }
+    access = generator.choice(("public", "protected", "private"))
+    tags = generator.sample(
+        ("nightly", "finance", "pii", "core"), k=generator.randint(0, 2)
+    )
+
+    return {
+        "unique_id": unique_id,
+        "name": name,
+        "package_name": package_name,
+        "resource_type": resource_type,
+        "path": f"marts/{name}.sql",
+        "original_file_path": f"models/marts/{name}.sql",
+        "fqn": [package_name, "marts", name],
+        "schema": "analytics",
+        "database": "warehouse",
+        "relation_name": f'"warehouse"."analytics"."{name}"',
+        "alias": name,
+        "checksum": {
+            "name": "sha256",
+            "checksum": f"{generator.getrandbits(256):064x}",
+        },
+        "access": access if resource_type == "model" else None,
+        "group": generator.choice(groups)
+        if groups and generator.random() < 0.3
+        else None,
+        "tags": tags,
+        "description": f"The {name} {resource_type}. " * 5,
+        "columns": columns,
+        "meta": {"owner": "data-platform"},
+        "config": {
+            "enabled": True,
+            "materialized": "table",
+            "tags": tags,
+            "access": access,
+            "event_time": "created_at" if generator.random() < 0.2 else None,
+        },
+        "raw_code": f"select * from {{{{ ref('{name}_upstream') }}}}\n" * 20,
+        "compiled_code": f'select * from "warehouse"."analytics"."{name}"\n' * 20,
+        "depends_on": {
+            "macros": ["macro.dbt.run_query"],
+            "nodes": upstream,
+        },
+    }
+
+
+def generate_manifest(
+    node_count: int,
+    project_name: str = "upstream",
+    package_count: int = 10,
+    group_count: int = 20,
+    versioned_ratio: float = 0.05,
+    seed: int = 0,
+) -> Dict:
+    """
+    Generate a deterministic synthetic manifest with `node_count` nodes spread
+    across `package_count` packages, including versioned models, groups, tests,
+    seeds, snapshots, and the other manifest sections that dbt-loom ignores.
+    """
+
+    generator = random.Random(seed)
+    packages = [project_name] + [
+        f"package_{index}" for index in range(package_count - 1)
+    ]
+    groups = [f"group_{index}" for index in range(group_count)]
+
+    nodes: Dict[str, Dict] = {}
+    unique_ids: List[str] = []
+
+    while len(nodes) < node_count:
+        index = len(nodes)
+        package_name = generator.choice(packages)
+        resource_type = generator.choices(
+            ("model", "test", "seed", "snapshot"), weights=(70, 20, 5, 5)
+        )[0]
+        upstream = generator.sample(unique_ids, k=min(len(unique_ids), 3))
+
+        if resource_type == "model" and generator.random() < versioned_ratio:
+            latest_version = generator.randint(2, 3)
+            for version in range(1, latest_version + 1):
+                node = generate_node(
+                    generator, "model", package_name, f"model_{index}", groups, upstream
+                )
+                node["unique_id"] = f"{node['unique_id']}.v{version}"
+                node["version"] = version
+                node["latest_version"] = latest_version
+                node["relation_name"] = (
+                    f'"warehouse"."analytics"."model_{index}_v{version}"'
+                )
+                nodes[node["unique_id"]] = node
+            unique_ids.append(node["unique_id"])
+            continue
+
+        node = generate_node(
+            generator,
+            resource_type,
+            package_name,
+            f"{resource_type}_{index}",
+            groups,
+            upstream,
+        )
+        nodes[node["unique_id"]] = node
+        if resource_type != "test":
+            unique_ids.append(node["unique_id"])
+
+    return {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json",
+            "dbt_version": "1.9.0",
+            "project_name": project_name,
+            "generated_at": "2024-01-01T00:00:00Z",
+        },
+        "nodes": nodes,
+        "sources": {},
+        "macros": {
+            f"macro.{project_name}.macro_{index}": {
+                "name": f"macro_{index}",
+                "macro_sql": "{% macro example() %} select 1 {% endmacro %}" * 10,
+            }
+            for index in range(node_count // 10)
+        },
+        "docs": {},
+        "groups": {
+            f"group.{project_name}.{group}": {
+                "name": group,
+                "package_name": project_name,
+                "owner": {"name": group},
+            }
+            for group in groups
+        },
+        "parent_map": {
+            unique_id: node["depends_on"]["nodes"] for unique_id, node in nodes.items()
+        },
+        "child_map": {unique_id: [] for unique_id in nodes},
+    }
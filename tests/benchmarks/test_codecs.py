@@ -0,0 +1,48 @@
+import json
+import os
+import time
+
+import pytest
+
+from dbt_loom.codecs import CODECS, Codec
+from dbt_loom.payload import ManifestPayload, decode_manifest
+from tests.benchmarks.synthetic import generate_manifest
+
+NODE_COUNT = int(os.environ.get("DBT_LOOM_BENCHMARK_CODEC_NODES", 10000))
+REPEAT = int(os.environ.get("DBT_LOOM_BENCHMARK_REPEAT", 3))
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DBT_LOOM_BENCHMARK"),
+    reason="Set DBT_LOOM_BENCHMARK=1 to run the dbt-loom benchmark suite.",
+)
+
+
+@pytest.fixture(scope="module")
+def manifest_content() -> bytes:
+    return json.dumps(generate_manifest(NODE_COUNT)).encode("utf-8")
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_codec_decode_throughput(codec: Codec, manifest_content: bytes):
+    """Compare the decode throughput and compression ratio of each supported codec."""
+
+    try:
+        compressed = codec.compress(manifest_content)
+    except ImportError:
+        pytest.skip(f"The {codec.name} codec is not installed.")
+
+    name = f"manifest.json{codec.suffixes[0]}"
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        manifest = decode_manifest(ManifestPayload(content=compressed, name=name))
+        timings.append(time.perf_counter() - start)
+
+    assert len(manifest["nodes"]) == NODE_COUNT
+
+    seconds = min(timings)
+    print(
+        f"\n{codec.name:<8} ratio {len(manifest_content) / len(compressed):>6.1f}x "
+        f"{len(manifest_content) / 2**20 / seconds:>8.1f} MiB/s decoded "
+        f"({seconds * 1000:.1f} ms for {len(compressed) / 2**20:.1f} MiB)"
+    )
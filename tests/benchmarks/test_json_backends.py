@@ -0,0 +1,59 @@
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from dbt_loom.payload import JSON_BACKENDS
+from tests.benchmarks.synthetic import generate_manifest
+
+NODE_COUNT = int(os.environ.get("DBT_LOOM_BENCHMARK_JSON_NODES", 10000))
+REPEAT = int(os.environ.get("DBT_LOOM_BENCHMARK_REPEAT", 3))
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DBT_LOOM_BENCHMARK"),
+    reason="Set DBT_LOOM_BENCHMARK=1 to run the dbt-loom benchmark suite.",
+)
+
+
+@pytest.fixture(scope="module")
+def manifest_content() -> bytes:
+    return json.dumps(generate_manifest(NODE_COUNT)).encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", list(JSON_BACKENDS))
+def test_json_backend_parse_time(backend: str, manifest_content: bytes):
+    """
+    Compare the time and peak memory each installed JSON backend takes to parse a
+    large manifest. Each run starts from a collected heap, and the previous
+    result is released first, so that runs do not skew each other.
+    """
+
+    loads = JSON_BACKENDS[backend].loads
+
+    timings = []
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        manifest = loads(manifest_content)
+        timings.append(time.perf_counter() - start)
+
+        assert manifest == json.loads(manifest_content)
+        del manifest
+
+    gc.collect()
+    tracemalloc.start()
+    manifest = loads(manifest_content)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del manifest
+
+    seconds = min(timings)
+    print(
+        f"\n{backend:<8} {seconds * 1000:>8.1f} ms "
+        f"{len(manifest_content) / 2**20 / seconds:>8.1f} MiB/s "
+        f"{peak_bytes / 2**20:>8.1f} MiB peak "
+        f"({len(manifest_content) / 2**20:.1f} MiB, {NODE_COUNT} nodes)"
+    )
@@ -0,0 +1,69 @@
+import gc
+import json
+import os
+import tracemalloc
+from typing import Callable, Dict
+
+import pytest
+
+from dbt_loom import (
+    LoomModelNodeArgs,
+    convert_model_nodes_to_model_node_args,
+    convert_raw_nodes_to_model_node_args,
+    identify_node_subgraph,
+)
+from tests.benchmarks.synthetic import generate_manifest
+
+NODE_COUNT = int(os.environ.get("DBT_LOOM_BENCHMARK_MEMORY_NODES", 10000))
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DBT_LOOM_BENCHMARK"),
+    reason="Set DBT_LOOM_BENCHMARK=1 to run the dbt-loom benchmark suite.",
+)
+
+CONVERSIONS: Dict[str, Callable[[Dict], Dict]] = {
+    "validated": lambda manifest: convert_model_nodes_to_model_node_args(
+        identify_node_subgraph(manifest)
+    ),
+    "raw": convert_raw_nodes_to_model_node_args,
+}
+
+
+def retained_bytes_per_node(convert: Callable[[Dict], Dict], content: str) -> float:
+    """
+    Measure the memory retained by converted nodes once the manifest they were
+    converted from has been released. The manifest is parsed while tracing, so
+    that strings the nodes keep alive from the manifest are counted.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    manifest = json.loads(content)
+    nodes = convert(manifest)
+    del manifest
+    gc.collect()
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return retained_bytes / len(nodes)
+
+
+@pytest.mark.parametrize("conversion", list(CONVERSIONS))
+def test_injected_node_memory(conversion: str, monkeypatch):
+    """Compare the memory retained per injected node with and without compaction."""
+
+    content = json.dumps(generate_manifest(NODE_COUNT))
+    convert = CONVERSIONS[conversion]
+
+    with monkeypatch.context() as patch:
+        patch.setattr(LoomModelNodeArgs, "_compact", lambda self: None)
+        baseline = retained_bytes_per_node(convert, content)
+    compact = retained_bytes_per_node(convert, content)
+
+    print(
+        f"\n{conversion:<10} {baseline:>8.0f} bytes/node uncompacted "
+        f"{compact:>8.0f} bytes/node compacted "
+        f"({1 - compact / baseline:.0%} smaller, {NODE_COUNT} nodes)"
+    )
+
+    assert compact < baseline
@@ -0,0 +1,166 @@
+import gc
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+import yaml
+
+from dbt_loom import (
+    convert_model_nodes_to_model_node_args,
+    dbtLoom,
+    identify_node_subgraph,
+)
+from dbt_loom.config import ManifestReference, ManifestReferenceType
+from dbt_loom.manifests import ManifestLoader
+from tests.benchmarks.synthetic import generate_manifest
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+SIZES = [
+    int(size)
+    for size in os.environ.get("DBT_LOOM_BENCHMARK_SIZES", "1000,10000").split(",")
+]
+REPEAT = int(os.environ.get("DBT_LOOM_BENCHMARK_REPEAT", 3))
+TIME_TOLERANCE = float(os.environ.get("DBT_LOOM_BENCHMARK_TIME_TOLERANCE", 2.0))
+MEMORY_TOLERANCE = float(os.environ.get("DBT_LOOM_BENCHMARK_MEMORY_TOLERANCE", 1.25))
+UPDATE_BASELINES = bool(os.environ.get("DBT_LOOM_BENCHMARK_UPDATE"))
+
+# Sub-millisecond phases are dominated by timer noise, so allow a fixed slack.
+TIME_SLACK = 0.01
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DBT_LOOM_BENCHMARK"),
+    reason="Set DBT_LOOM_BENCHMARK=1 to run the dbt-loom benchmark suite.",
+)
+
+
+@dataclass
+class Measurement:
+    """The wall time and peak traced memory of a benchmarked phase."""
+
+    seconds: float
+    peak_bytes: int
+
+
+def measure(function: Callable[[], object]) -> Measurement:
+    """
+    Measure the best wall time of a function over `REPEAT` runs, and the peak
+    memory it allocates in a separate run, since tracing skews timings.
+    """
+
+    timings = []
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Measurement(seconds=min(timings), peak_bytes=peak_bytes)
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}_nodes")
+def manifest_path(request, tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("benchmarks") / f"manifest_{request.param}.json"
+    path.write_text(json.dumps(generate_manifest(request.param)))
+    return path
+
+
+def test_plugin_initialization(manifest_path: Path, monkeypatch):
+    """Benchmark each phase of dbt-loom's initialization against stored baselines."""
+
+    config_path = manifest_path.parent / "dbt_loom.config.yml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                "manifests": [
+                    {
+                        "name": "upstream",
+                        "type": "file",
+                        "config": {"path": str(manifest_path)},
+                    }
+                ]
+            }
+        )
+    )
+    monkeypatch.setenv("DBT_LOOM_CONFIG", str(config_path))
+
+    manifest_reference = ManifestReference(
+        name="upstream",
+        type=ManifestReferenceType.file,
+        config={"path": str(manifest_path)},  # type: ignore
+    )
+    manifest_loader = ManifestLoader()
+    manifest = manifest_loader.load(manifest_reference)
+    selected_nodes = identify_node_subgraph(manifest)
+    plugin = dbtLoom("downstream")
+
+    results: Dict[str, Measurement] = {
+        "load": measure(lambda: manifest_loader.load(manifest_reference)),
+        "identify_node_subgraph": measure(lambda: identify_node_subgraph(manifest)),
+        "convert_model_nodes_to_model_node_args": measure(
+            lambda: convert_model_nodes_to_model_node_args(selected_nodes)
+        ),
+        "initialize": measure(lambda: dbtLoom("downstream")),
+        "get_nodes": measure(plugin.get_nodes),
+    }
+
+    size = manifest_path.stem.split("_")[-1]
+    print(f"\ndbt-loom benchmarks for {size} nodes")
+    for phase, measurement in results.items():
+        print(
+            f"  {phase:<40} {measurement.seconds * 1000:>10.1f} ms "
+            f"{measurement.peak_bytes / 2**20:>10.1f} MiB peak"
+        )
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"  {'process max RSS':<40} {max_rss / 1024:>24.1f} MiB")
+
+    baselines = (
+        json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    )
+
+    if UPDATE_BASELINES:
+        baselines[size] = {
+            phase: asdict(measurement) for phase, measurement in results.items()
+        }
+        BASELINES_PATH.write_text(
+            json.dumps(baselines, indent=2, sort_keys=True) + "\n"
+        )
+        return
+
+    if size not in baselines:
+        pytest.skip(f"No stored baseline for {size} nodes.")
+
+    regressions = []
+    for phase, measurement in results.items():
+        baseline = Measurement(**baselines[size][phase])
+        if measurement.seconds > baseline.seconds * TIME_TOLERANCE + TIME_SLACK:
+            regressions.append(
+                f"{phase} took {measurement.seconds:.3f}s "
+                f"(baseline {baseline.seconds:.3f}s)"
+            )
+        if measurement.peak_bytes > baseline.peak_bytes * MEMORY_TOLERANCE:
+            regressions.append(
+                f"{phase} allocated {measurement.peak_bytes} bytes "
+                f"(baseline {baseline.peak_bytes} bytes)"
+            )
+
+    assert not regressions, "Performance regressions detected:\n" + "\n".join(
+        regressions
+    )
@@ -0,0 +1,46 @@
+import os
+import timeit
+from pathlib import Path
+
+import pytest
+
+from dbt_loom import dbtLoom
+
+ITERATIONS = int(os.environ.get("DBT_LOOM_BENCHMARK_TELEMETRY_CALLS", 10000))
+
+# Filtering should be effectively free compared to sending an event.
+MAX_SECONDS_PER_CALL = 50e-6
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DBT_LOOM_BENCHMARK"),
+    reason="Set DBT_LOOM_BENCHMARK=1 to run the dbt-loom benchmark suite.",
+)
+
+
+def test_tracking_wrapper_filter_time(tmp_path: Path, monkeypatch):
+    """Measure the time the tracking wrapper takes to drop a dbt-loom event."""
+    from snowplow_tracker import SelfDescribingJson
+
+    monkeypatch.setenv("DBT_LOOM_CONFIG", str(tmp_path / "dbt_loom.config.yml"))
+    plugin = dbtLoom("downstream")
+
+    sent_events = []
+    track = plugin.tracking_wrapper(lambda *args, **kwargs: sent_events.append(kwargs))
+    plugin_event = [
+        SelfDescribingJson(
+            "iglu:com.dbt/plugin_get_nodes/jsonschema/1-0-0",
+            {"plugin_name": "dbtLoom", "num_model_nodes": 1},
+        )
+    ]
+
+    seconds = min(
+        timeit.repeat(
+            lambda: track(None, action="plugin_get_nodes", context=plugin_event),
+            number=ITERATIONS,
+            repeat=3,
+        )
+    )
+    print(f"\ntracking_wrapper {seconds / ITERATIONS * 1e6:.2f}µs per call")
+
+    assert sent_events == []
+    assert seconds / ITERATIONS < MAX_SECONDS_PER_CALL
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import dbt
 from dbt.cli.main import dbtRunner, dbtRunnerResult
+from dbt.contracts.graph.manifest import Manifest
 
 
 import dbt.exceptions
@@ -204,3 +205,52 @@ def test_dbt_loom_injects_microbatch_event_time():
         assert "has no 'ref' or 'source' input with an 'event_time' configuration" not in log_contents
 
     os.chdir(starting_path)
+
+
+def test_dbt_parse_stays_partial_with_unchanged_upstreams():
+    """Verify that injected nodes are stable, so that repeated parses use partial parsing."""
+
+    runner = dbtRunner()
+
+    os.chdir(f"{starting_path}/test_projects/revenue")
+    runner.invoke(["clean"])
+    runner.invoke(["deps"])
+    runner.invoke(["compile"])
+
+    os.chdir(f"{starting_path}/test_projects/customer_success")
+    runner.invoke(["clean"])
+    runner.invoke(["deps"])
+    first: dbtRunnerResult = runner.invoke(["parse"])
+
+    events = []
+    second: dbtRunnerResult = dbtRunner(callbacks=[events.append]).invoke(["parse"])
+    event_names = [event.info.name for event in events]
+
+    os.chdir(starting_path)
+
+    assert first.exception is None
+    assert second.exception is None
+
+    # A full parse is always preceded by an event explaining why.
+    assert "UnableToPartialParse" not in event_names
+    assert "ParsedFileLoadFailed" not in event_names
+
+    # The second parse reused the saved manifest, and found no changed files.
+    partial_parses = [
+        event.data for event in events if event.info.name == "PartialParsingEnabled"
+    ]
+    assert len(partial_parses) == 1
+    assert partial_parses[0].added == 0
+    assert partial_parses[0].changed == 0
+    assert partial_parses[0].deleted == 0
+
+    def injected_checksums(result: dbtRunnerResult):
+        assert isinstance(result.result, Manifest)
+        return {
+            unique_id: node.checksum
+            for unique_id, node in result.result.nodes.items()
+            if node.package_name == "revenue"
+        }
+
+    assert "model.revenue.orders.v1" in injected_checksums(first)
+    assert injected_checksums(first) == injected_checksums(second)
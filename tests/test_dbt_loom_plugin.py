@@ -0,0 +1,421 @@
+import datetime
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+import pytest
+import yaml
+
+from dbt_loom import dbtLoom
+
+
+def build_manifest(project_name: str, model_names: List[str], padding: int = 0) -> Dict:
+    """
+    Build a minimal manifest containing public models for a project. Nodes are
+    padded with `padding` bytes of SQL to mimic the size of real manifest nodes.
+    """
+
+    nodes = {
+        f"model.{project_name}.{name}": {
+            "unique_id": f"model.{project_name}.{name}",
+            "name": name,
+            "package_name": project_name,
+            "schema": "main",
+            "database": "database",
+            "resource_type": "model",
+            "access": "public",
+            "config": {},
+            "raw_code": "select 1" + " " * padding,
+            "columns": {
+                f"column_{index}": {"name": f"column_{index}", "description": ""}
+                for index in range(padding // 100)
+            },
+        }
+        for name in model_names
+    }
+
+    return {"metadata": {"project_name": project_name}, "nodes": nodes}
+
+
+@pytest.fixture
+def loom_config(tmp_path: Path, monkeypatch) -> Callable[..., Path]:
+    """Write a dbt-loom configuration file and point dbt-loom at it."""
+
+    def write_config(manifests: Dict[str, Dict], **options) -> Path:
+        references = []
+        for name, manifest in manifests.items():
+            path = tmp_path / f"{name}.json"
+            if manifest:
+                path.write_text(json.dumps(manifest))
+
+            references.append(
+                {
+                    "name": name,
+                    "type": "file",
+                    "optional": not manifest,
+                    "config": {"path": str(path)},
+                }
+            )
+
+        config_path = tmp_path / "dbt_loom.config.yml"
+        config_path.write_text(yaml.dump({"manifests": references, **options}))
+        monkeypatch.setenv("DBT_LOOM_CONFIG", str(config_path))
+        return config_path
+
+    return write_config
+
+
+def test_concurrent_loading_preserves_configuration_order(loom_config):
+    """Confirm that concurrently loaded references are merged in configuration order."""
+
+    manifests = {
+        f"project_{index}": build_manifest(f"project_{index}", ["orders", "accounts"])
+        for index in range(6)
+    }
+    loom_config(manifests, max_concurrency=4)
+
+    plugin = dbtLoom("downstream")
+
+    assert list(plugin.manifests.keys()) == list(manifests.keys())
+    assert list(plugin.models.keys()) == [
+        unique_id
+        for manifest in manifests.values()
+        for unique_id in sorted(manifest["nodes"])
+    ]
+
+
+def test_concurrent_loading_skips_missing_optional_references(loom_config):
+    """Confirm that optional references are still skipped when loading concurrently."""
+
+    loom_config(
+        {
+            "revenue": build_manifest("revenue", ["orders"]),
+            "missing": {},
+        },
+        max_concurrency=2,
+    )
+
+    plugin = dbtLoom("downstream")
+
+    assert list(plugin.manifests.keys()) == ["revenue"]
+    assert set(plugin.models.keys()) == {"model.revenue.orders"}
+
+
+def test_initialize_releases_raw_manifests(loom_config, tmp_path: Path):
+    """Confirm that dbt-loom only retains a compact summary of each upstream manifest."""
+
+    manifest = build_manifest(
+        "revenue", [f"model_{index}" for index in range(500)], padding=2000
+    )
+    loom_config({"revenue": manifest})
+
+    # Measure the memory required to hold the parsed manifest as a baseline.
+    tracemalloc.start()
+    parsed_manifest = json.loads((tmp_path / "revenue.json").read_text())
+    manifest_size, _ = tracemalloc.get_traced_memory()
+    del parsed_manifest
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    plugin = dbtLoom("downstream")
+    gc.collect()
+    retained_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    summary = plugin.manifests["revenue"]
+    assert summary.node_count == 500
+    assert summary.injected_node_count == 500
+    assert retained_size < manifest_size / 4, (
+        f"dbt-loom retained {retained_size} bytes for a manifest that requires "
+        f"{manifest_size} bytes."
+    )
+
+
+def test_group_validation_uses_injected_groups(loom_config):
+    """Confirm that group validation accepts injected groups without rescanning models."""
+
+    manifest = build_manifest("revenue", ["orders", "accounts"])
+    manifest["nodes"]["model.revenue.orders"]["group"] = "sales"
+    loom_config({"revenue": manifest})
+
+    plugin = dbtLoom("downstream")
+    assert plugin.get_groups() == {"sales"}
+
+    received_group_names = []
+
+    def check_valid_group_config_node(inner_self, groupable_node, valid_group_names):
+        received_group_names.append(valid_group_names)
+        return True
+
+    wrapped_function = plugin.group_validation_wrapper(check_valid_group_config_node)
+    local_group_names = {"finance"}
+
+    for group in (None, "finance", "sales", "sales"):
+        wrapped_function(None, SimpleNamespace(group=group), local_group_names)
+
+    assert received_group_names[:2] == [local_group_names, local_group_names]
+    assert received_group_names[2] == {"finance", "sales"}
+    assert received_group_names[3] is received_group_names[2]
+
+
+def test_tracking_wrapper_blocks_loom_events(loom_config):
+    """Confirm that telemetry about dbt-loom is dropped, and other events are sent."""
+    from snowplow_tracker import SelfDescribingJson
+
+    loom_config({"revenue": build_manifest("revenue", ["orders"])})
+    plugin = dbtLoom("downstream")
+
+    sent_events = []
+    track = plugin.tracking_wrapper(lambda *args, **kwargs: sent_events.append(kwargs))
+
+    plugin_event = [
+        SelfDescribingJson(
+            "iglu:com.dbt/plugin_get_nodes/jsonschema/1-0-0",
+            {"plugin_name": "dbtLoom", "num_model_nodes": 1},
+        )
+    ]
+    other_event = [
+        SelfDescribingJson(
+            "iglu:com.dbt/invocation/jsonschema/1-0-2", {"command": "build"}
+        )
+    ]
+
+    track(None, action="plugin_get_nodes", context=plugin_event)
+    track(None, action="invocation", context=other_event)
+    assert [event["action"] for event in sent_events] == ["invocation"]
+
+
+def test_initialize_records_phase_timings(loom_config, tmp_path: Path):
+    """Confirm that each phase of loading a reference is timed and written to an artifact."""
+
+    timings_path = tmp_path / "target" / "dbt_loom_timings.json"
+    loom_config(
+        {"revenue": build_manifest("revenue", ["orders", "accounts"])},
+        timings={"path": str(timings_path)},
+    )
+
+    plugin = dbtLoom("downstream")
+
+    artifact = json.loads(timings_path.read_text())
+    assert artifact["injected_node_count"] == 2
+    assert artifact["references"] == [plugin.timings[0].to_dict()]
+
+    reference = artifact["references"][0]
+    assert reference["name"] == "revenue"
+    assert [phase["phase"] for phase in reference["phases"]] == [
+        "read",
+        "parse",
+        "select",
+        "convert",
+    ]
+
+    read, parse, select, convert = reference["phases"]
+    assert read["bytes"] == parse["bytes"] == (tmp_path / "revenue.json").stat().st_size
+    assert select["nodes"] == convert["nodes"] == 2
+    assert all(phase["seconds"] >= 0 for phase in reference["phases"])
+
+
+def test_delta_mode_only_converts_changed_nodes(loom_config, tmp_path: Path):
+    """Confirm that delta mode reuses converted nodes whose raw node is unchanged."""
+
+    manifest = build_manifest("revenue", ["orders", "accounts", "invoices"])
+    options = {
+        "cache": {"path": str(tmp_path / "cache"), "delta": True},
+        "timings": {"path": str(tmp_path / "timings.json")},
+    }
+    loom_config({"revenue": manifest}, **options)
+
+    def selected_nodes(plugin: dbtLoom) -> int:
+        phases = {phase.phase: phase for phase in plugin.timings[0].phases}
+        assert phases["select"].nodes is not None
+        return phases["select"].nodes
+
+    first = dbtLoom("downstream")
+    assert selected_nodes(first) == 3
+
+    manifest["nodes"]["model.revenue.accounts"]["access"] = "protected"
+    loom_config({"revenue": manifest}, **options)
+
+    second = dbtLoom("downstream")
+    assert selected_nodes(second) == 1
+    assert list(second.models.keys()) == list(first.models.keys())
+    assert second.models["model.revenue.accounts"].access == "protected"
+    assert second.models["model.revenue.orders"] == first.models["model.revenue.orders"]
+
+    del manifest["nodes"]["model.revenue.invoices"]
+    loom_config({"revenue": manifest}, **options)
+
+    third = dbtLoom("downstream")
+    assert selected_nodes(third) == 0
+    assert set(third.models.keys()) == {
+        "model.revenue.orders",
+        "model.revenue.accounts",
+    }
+
+
+def test_snapshot_skips_parsing_unchanged_manifests(loom_config, tmp_path: Path):
+    """Confirm that unchanged manifests are injected from a snapshot of their nodes."""
+
+    manifest = build_manifest("revenue", ["orders", "accounts"])
+    options = {"cache": {"path": str(tmp_path / "cache"), "snapshot": True}}
+    loom_config({"revenue": manifest}, **options)
+
+    def phases(plugin: dbtLoom) -> List[str]:
+        return [phase.phase for phase in plugin.timings[0].phases]
+
+    first = dbtLoom("downstream")
+    assert "parse" in phases(first)
+
+    second = dbtLoom("downstream")
+    assert phases(second) == ["hash", "snapshot"]
+    assert second.models == first.models
+    assert second.manifests["revenue"].node_count == 2
+
+    manifest["nodes"]["model.revenue.accounts"]["access"] = "protected"
+    loom_config({"revenue": manifest}, **options)
+
+    third = dbtLoom("downstream")
+    assert "parse" in phases(third)
+    assert third.models["model.revenue.accounts"].access == "protected"
+
+    config_path = loom_config({"revenue": manifest}, **options)
+    config = yaml.safe_load(config_path.read_text())
+    config["manifests"][0]["excluded_packages"] = ["revenue"]
+    config_path.write_text(yaml.dump(config))
+
+    fourth = dbtLoom("downstream")
+    assert "parse" in phases(fourth)
+    assert fourth.models == {}
+
+
+def test_snapshot_is_not_reused_across_validation_modes(loom_config, tmp_path: Path):
+    """Confirm that nodes converted without validation are not reused once it is enabled."""
+
+    manifest = build_manifest("revenue", ["orders", "accounts"])
+    options = {"cache": {"path": str(tmp_path / "cache"), "snapshot": True}}
+
+    def phases(plugin: dbtLoom) -> List[str]:
+        return [phase.phase for phase in plugin.timings[0].phases]
+
+    loom_config({"revenue": manifest}, validate_nodes=False, **options)
+    unvalidated = dbtLoom("downstream")
+    assert "select" not in phases(unvalidated)
+
+    loom_config({"revenue": manifest}, validate_nodes=True, **options)
+    validated = dbtLoom("downstream")
+    assert "select" in phases(validated)
+    assert validated.models == unvalidated.models
+
+    assert phases(dbtLoom("downstream")) == ["hash", "snapshot"]
+
+
+def test_injected_nodes_are_deterministic(loom_config):
+    """Confirm that an unchanged manifest always produces identical injected nodes."""
+
+    manifest = build_manifest("revenue", ["orders", "accounts", "invoices"])
+    manifest["metadata"]["generated_at"] = "2024-05-01T12:00:00.000000Z"
+    loom_config({"revenue": manifest})
+
+    first = dbtLoom("downstream")
+    second = dbtLoom("downstream")
+
+    assert first.models == second.models
+    assert first.fingerprint == second.fingerprint
+    assert {node.generated_at for node in first.models.values()} == {
+        datetime.datetime(2024, 5, 1, 12)
+    }
+
+    manifest["nodes"] = dict(reversed(list(manifest["nodes"].items())))
+    loom_config({"revenue": manifest})
+
+    reordered = dbtLoom("downstream")
+    assert list(reordered.models.keys()) == list(first.models.keys())
+    assert reordered.fingerprint == first.fingerprint
+
+    manifest["nodes"]["model.revenue.orders"]["access"] = "protected"
+    loom_config({"revenue": manifest})
+
+    assert dbtLoom("downstream").fingerprint != first.fingerprint
+
+
+def test_lazy_loading_skips_unreferenced_projects(
+    loom_config, tmp_path: Path, monkeypatch
+):
+    """Confirm that lazy loading only loads projects referenced by the current project."""
+
+    monkeypatch.chdir(tmp_path)
+    # Earlier dbt invocations leave a global project directory set in dbt's flags.
+    monkeypatch.setattr("dbt_loom.get_flags", lambda: SimpleNamespace(PROJECT_DIR=None))
+    (tmp_path / "dbt_project.yml").write_text(
+        yaml.dump({"name": "downstream", "model-paths": ["transform"]})
+    )
+    (tmp_path / "transform" / "staging").mkdir(parents=True)
+    (tmp_path / "transform" / "staging" / "orders.sql").write_text(
+        "select * from {{ ref( 'revenue' , \"orders\", v=2) }}\n"
+        "join {{ ref('accounts') }} using (account_id)"
+    )
+    (tmp_path / "transform" / "forecast.py").write_text(
+        "def model(dbt, session):\n    return dbt.ref(\"finance\", 'forecast')\n"
+    )
+
+    manifests = {
+        name: build_manifest(name, ["orders"])
+        for name in ("revenue", "finance", "marketing", "accounts")
+    }
+    loom_config(manifests, lazy_loading={})
+
+    plugin = dbtLoom("downstream")
+    assert list(plugin.manifests.keys()) == ["revenue", "finance"]
+    assert [timing.name for timing in plugin.timings] == ["revenue", "finance"]
+
+    loom_config(manifests, lazy_loading={"projects": ["marketing"]})
+
+    plugin = dbtLoom("downstream")
+    assert list(plugin.manifests.keys()) == ["revenue", "finance", "marketing"]
+
+
+def test_prune_nodes_injects_only_referenced_nodes(
+    loom_config, tmp_path: Path, monkeypatch
+):
+    """Confirm that pruning keeps referenced nodes, including every version of them."""
+
+    monkeypatch.chdir(tmp_path)
+    # Earlier dbt invocations leave a global project directory set in dbt's flags.
+    monkeypatch.setattr("dbt_loom.get_flags", lambda: SimpleNamespace(PROJECT_DIR=None))
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "orders.sql").write_text(
+        "select * from {{ ref('revenue', 'orders') }}"
+    )
+
+    manifest = build_manifest("revenue", ["orders", "accounts", "invoices"])
+    orders = manifest["nodes"].pop("model.revenue.orders")
+    for version in (1, 2):
+        manifest["nodes"][f"model.revenue.orders.v{version}"] = {
+            **orders,
+            "unique_id": f"model.revenue.orders.v{version}",
+            "version": version,
+            "latest_version": 2,
+            "depends_on": {"nodes": ["model.revenue.accounts"]},
+        }
+    loom_config({"revenue": manifest}, lazy_loading={"prune_nodes": True})
+
+    plugin = dbtLoom("downstream")
+    assert set(plugin.models.keys()) == {
+        "model.revenue.orders.v1",
+        "model.revenue.orders.v2",
+    }
+    assert plugin.manifests["revenue"].injected_node_count == 2
+    assert all(node.depends_on_nodes == [] for node in plugin.models.values())
+
+    events: List[str] = []
+    monkeypatch.setattr("dbt_loom.fire_event", lambda msg: events.append(msg))
+    resolve_ref = plugin.resolve_ref_wrapper(lambda *args, **kwargs: None)
+
+    resolve_ref(None, None, "orders", "revenue", None, "downstream", "downstream")
+    assert events == []
+
+    resolve_ref(None, None, "accounts", "revenue", None, "downstream", "downstream")
+    assert "ref('revenue', 'accounts')" in events[0]
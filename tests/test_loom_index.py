@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from dbt_loom import convert_model_nodes_to_model_node_args, identify_node_subgraph
+from dbt_loom.index import build_loom_index, is_loom_index, main
+from dbt_loom.payload import ManifestPayload, decode_manifest
+
+
+@pytest.fixture
+def manifest() -> Dict:
+    return {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json",
+            "project_name": "revenue",
+        },
+        "nodes": {
+            "model.revenue.orders.v1": {
+                "unique_id": "model.revenue.orders.v1",
+                "name": "orders",
+                "package_name": "revenue",
+                "resource_type": "model",
+                "schema": "main",
+                "database": "database",
+                "relation_name": '"database"."main"."orders_v1"',
+                "version": 1,
+                "latest_version": 2,
+                "access": "public",
+                "group": "sales",
+                "raw_code": "select * from {{ ref('stg_orders') }}",
+                "columns": {"order_id": {"name": "order_id"}},
+                "depends_on": {
+                    "nodes": ["model.revenue.stg_orders"],
+                    "macros": ["macro.dbt.run_query"],
+                },
+                "config": {"event_time": "ordered_at", "materialized": "table"},
+            },
+            "model.revenue.stg_orders": {
+                "unique_id": "model.revenue.stg_orders",
+                "name": "stg_orders",
+                "package_name": "revenue",
+                "resource_type": "model",
+                "schema": "main",
+                "config": {"access": "protected"},
+            },
+            "test.revenue.not_null_orders": {
+                "unique_id": "test.revenue.not_null_orders",
+                "name": "not_null_orders",
+                "package_name": "revenue",
+                "resource_type": "test",
+                "schema": "main",
+            },
+        },
+        "macros": {"macro.dbt.run_query": {"name": "run_query"}},
+        "groups": {
+            "group.revenue.sales": {
+                "name": "sales",
+                "package_name": "revenue",
+                "owner": {"name": "Sales"},
+                "description": "The sales team.",
+            }
+        },
+    }
+
+
+def test_loom_index_parity(manifest):
+    """Confirm that a loom index produces the same injected nodes as its manifest."""
+
+    loom_index = build_loom_index(manifest)
+
+    assert is_loom_index(loom_index)
+    assert set(loom_index["nodes"]) == {
+        "model.revenue.orders.v1",
+        "model.revenue.stg_orders",
+    }
+    assert "macros" not in loom_index
+
+    def injected_nodes(manifest: Dict) -> Dict:
+        return {
+            unique_id: {
+                key: value for key, value in vars(node).items() if key != "generated_at"
+            }
+            for unique_id, node in convert_model_nodes_to_model_node_args(
+                identify_node_subgraph(manifest)
+            ).items()
+        }
+
+    assert injected_nodes(loom_index) == injected_nodes(
+        json.loads(json.dumps(manifest))
+    )
+
+
+def test_loom_index_command(manifest, tmp_path: Path):
+    """Confirm that the loom index command writes a compressed index."""
+
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+    output_path = tmp_path / "loom_index.json.gz"
+
+    main([str(manifest_path), "--output", str(output_path)])
+
+    loom_index = decode_manifest(
+        ManifestPayload(content=output_path.read_bytes(), name=output_path.name)
+    )
+    assert loom_index == json.loads(json.dumps(build_loom_index(manifest)))
@@ -1,3 +1,10 @@
+from copy import deepcopy
+
+from dbt_loom import (
+    convert_model_nodes_to_model_node_args,
+    convert_raw_nodes_to_model_node_args,
+    identify_node_subgraph,
+)
 from dbt_loom.manifests import ManifestNode
 
 
@@ -21,3 +28,66 @@ def test_rewrite_resource_types():
     manifest_node = ManifestNode(**(node))  # type: ignore
 
     assert manifest_node.resource_type == NodeType.Seed
+
+
+def test_fast_path_parity():
+    """Confirm that the fast path produces the same nodes as the validated path."""
+
+    manifest = {
+        "nodes": {
+            "model.revenue.orders.v2": {
+                "unique_id": "model.revenue.orders.v2",
+                "name": "orders",
+                "package_name": "revenue",
+                "resource_type": "model",
+                "schema": "main",
+                "database": "analytics",
+                "relation_name": '"analytics"."main"."orders_v2"',
+                "version": 2,
+                "latest_version": 2.0,
+                "deprecation_date": "2030-01-01T00:00:00Z",
+                "group": "sales",
+                "depends_on": {
+                    "nodes": ["source.revenue.raw.orders", "model.revenue.stg_orders"]
+                },
+                "config": {"access": "public", "event_time": "ordered_at"},
+            },
+            "model.revenue.stg_orders": {
+                "unique_id": "model.revenue.stg_orders",
+                "name": "stg_orders",
+                "package_name": "revenue",
+                "resource_type": "model",
+                "schema": "main",
+                "access": "private",
+                "config": {},
+            },
+            "snapshot.revenue.orders_snapshot": {
+                "unique_id": "snapshot.revenue.orders_snapshot",
+                "name": "orders_snapshot",
+                "package_name": "revenue",
+                "resource_type": "model",
+                "schema": "snapshots",
+                "relation_name": "`analytics`.`snapshots`.`orders_snapshot`",
+            },
+            "test.revenue.not_null_orders": {
+                "unique_id": "test.revenue.not_null_orders",
+                "name": "not_null_orders",
+                "package_name": "revenue",
+                "resource_type": "test",
+                "schema": "main",
+            },
+        }
+    }
+
+    def comparable(nodes):
+        return {unique_id: vars(node) for unique_id, node in nodes.items()}
+
+    validated = convert_model_nodes_to_model_node_args(
+        identify_node_subgraph(deepcopy(manifest))
+    )
+    fast = convert_raw_nodes_to_model_node_args(deepcopy(manifest))
+
+    assert comparable(fast) == comparable(validated)
+    assert [node.unique_id for node in fast.values()] == [
+        node.unique_id for node in validated.values()
+    ]
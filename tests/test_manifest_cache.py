@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from dbt_loom.cache import ManifestCache
+from dbt_loom.config import (
+    FileReferenceConfig,
+    ManifestReference,
+    ManifestReferenceType,
+)
+from dbt_loom.manifests import ManifestLoader
+from dbt_loom.payload import ManifestPayload
+
+
+class FakeRemote:
+    """A fake remote location that serves a manifest and honors ETags."""
+
+    def __init__(self, content: dict, etag: str) -> None:
+        self.content = content
+        self.etag = etag
+        self.requested_versions: List[Optional[str]] = []
+
+    def fetch(self, config, version=None, last_modified=None):
+        self.requested_versions.append(version)
+        if version == self.etag:
+            return None
+
+        return ManifestPayload(
+            content=json.dumps(self.content).encode("utf-8"),
+            name="manifest.json",
+            version=self.etag,
+        )
+
+
+def build_reference() -> ManifestReference:
+    return ManifestReference(
+        name="revenue",
+        type=ManifestReferenceType.file,
+        config=FileReferenceConfig(
+            path=urlparse("https://example.com/revenue/manifest.json")
+        ),
+    )
+
+
+def test_cache_revalidates_unchanged_manifest(tmp_path: Path):
+    """Confirm that an unchanged manifest is served from the cache after revalidation."""
+
+    remote = FakeRemote(content={"foo": "bar"}, etag='"v1"')
+    manifest_loader = ManifestLoader(cache=ManifestCache(path=tmp_path))
+    manifest_loader.fetching_functions[ManifestReferenceType.file] = remote.fetch
+
+    assert manifest_loader.load(build_reference()) == {"foo": "bar"}
+    assert manifest_loader.load(build_reference()) == {"foo": "bar"}
+    assert remote.requested_versions == [None, '"v1"']
+
+    # A changed manifest replaces the cached copy.
+    remote.content, remote.etag = {"foo": "baz"}, '"v2"'
+    assert manifest_loader.load(build_reference()) == {"foo": "baz"}
+    assert len(list((tmp_path / "objects").iterdir())) == 1
+
+
+def test_cache_skips_revalidation_within_ttl(tmp_path: Path):
+    """Confirm that cached manifests are used without any request within the TTL."""
+
+    remote = FakeRemote(content={"foo": "bar"}, etag='"v1"')
+    manifest_loader = ManifestLoader(cache=ManifestCache(path=tmp_path, ttl=3600))
+    manifest_loader.fetching_functions[ManifestReferenceType.file] = remote.fetch
+
+    manifest_loader.load(build_reference())
+    assert manifest_loader.load(build_reference()) == {"foo": "bar"}
+    assert remote.requested_versions == [None]
@@ -1,17 +1,32 @@
+import bz2
+import gzip
+import hashlib
+import http.server
+import io
 import json
+import sys
+import threading
+import zlib
 from pathlib import Path
-
-from typing import Dict, Generator, Tuple
+from types import SimpleNamespace
+from typing import Dict, Generator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import pytest
+import requests
+from dbt_loom import codecs, payload
+from dbt_loom.clients import gcs
 from dbt_loom.config import (
     FileReferenceConfig,
     ManifestReference,
     ManifestReferenceType,
     LoomConfigurationError,
 )
+from dbt_loom.clients.dbx import DatabricksReferenceConfig
+from dbt_loom.clients.s3 import S3Client, S3ReferenceConfig
 from dbt_loom.manifests import ManifestLoader, UnknownManifestPathType
+from dbt_loom.payload import ManifestPayload, decode_manifest
+from dbt_loom.sessions import create_session
 
 
 @pytest.fixture
@@ -130,3 +145,587 @@ def test_load_from_local_filesystem_not_optional_missing():
     manifest_loader = ManifestLoader()
     with pytest.raises(LoomConfigurationError):
         manifest_loader.load(manifest_reference)
+
+
+def test_load_from_local_filesystem_streaming(tmp_path):
+    """Confirm that streaming mode only materializes metadata and injectable nodes."""
+    pytest.importorskip("ijson")
+
+    model = {
+        "unique_id": "model.revenue.orders",
+        "name": "orders",
+        "package_name": "revenue",
+        "schema": "main",
+        "version": 1.5,
+        "depends_on": {"nodes": ["model.revenue.stg_orders"], "macros": []},
+        "config": {"meta": {"owner": None, "tags": ["a", "b"]}},
+    }
+    manifest = {
+        "metadata": {"project_name": "revenue", "env": {"key": "value"}},
+        "nodes": {
+            "model.revenue.orders": model,
+            "test.revenue.not_null_orders": {"name": "not_null_orders"},
+        },
+        "macros": {"macro.revenue.cents_to_dollars": {"name": "cents_to_dollars"}},
+        "child_map": {"model.revenue.orders": []},
+    }
+    path = tmp_path / "manifest.json.gz"
+    with gzip.open(path, "wt") as file:
+        json.dump(manifest, file)
+
+    file_config = FileReferenceConfig(path=str(path))  # type: ignore
+
+    output = ManifestLoader.load_from_local_filesystem(file_config, streaming=True)
+
+    assert output == {
+        "metadata": manifest["metadata"],
+        "nodes": {"model.revenue.orders": model},
+    }
+
+
+class ChunkedStream:
+    """A non-seekable byte stream that records the size of each read, like a network body."""
+
+    def __init__(self, content: bytes) -> None:
+        self.stream = io.BytesIO(content)
+        self.read_sizes: List[int] = []
+        self.closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return self.stream.read(size)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_decode_manifest_streams_compressed_payloads():
+    """Confirm that streamed payloads are decompressed and parsed without buffering the body."""
+    pytest.importorskip("ijson")
+
+    manifest = {
+        "metadata": {"project_name": "revenue"},
+        "nodes": {
+            f"model.revenue.model_{index}": {"name": f"model_{index}"}
+            for index in range(10_000)
+        },
+    }
+    stream = ChunkedStream(gzip.compress(json.dumps(manifest).encode("utf-8")))
+
+    output = decode_manifest(
+        ManifestPayload(content=None, name="manifest.json.gz", stream=stream),  # type: ignore
+        streaming=True,
+    )
+
+    assert output == manifest
+    assert stream.closed
+    assert all(0 <= size < len(stream.stream.getvalue()) for size in stream.read_sizes)
+
+
+@pytest.mark.parametrize(
+    "codec_name,module_name",
+    [
+        ("gzip", "gzip"),
+        ("zstd", "compression.zstd" if sys.version_info >= (3, 14) else "zstandard"),
+        ("brotli", "brotli"),
+    ],
+)
+def test_load_from_local_filesystem_codecs(tmp_path, codec_name, module_name):
+    """Confirm that manifests compressed with each supported codec can be loaded."""
+    pytest.importorskip(module_name)
+
+    codec = next(codec for codec in codecs.CODECS if codec.name == codec_name)
+    manifest = {"metadata": {"project_name": "revenue"}, "nodes": {}}
+    path = tmp_path / f"manifest.json{codec.suffixes[0]}"
+    path.write_bytes(codec.compress(json.dumps(manifest).encode("utf-8")))
+
+    file_config = FileReferenceConfig(path=str(path))  # type: ignore
+
+    assert ManifestLoader.load_from_local_filesystem(file_config) == manifest
+
+
+def test_detect_codec_by_magic_number_and_suffix(monkeypatch):
+    """Confirm that codecs are detected by magic number first, and by suffix only for non-JSON content."""
+    monkeypatch.setattr(codecs, "CODECS", list(codecs.CODECS))
+    bz2_codec = codecs.Codec(
+        name="bz2",
+        suffixes=(".bz2",),
+        magic_number=b"BZh",
+        decompress_stream=lambda stream: bz2.BZ2File(stream),  # type: ignore
+        compress=bz2.compress,
+    )
+    codecs.register_codec(bz2_codec)
+
+    assert codecs.detect_codec(bz2.compress(b"{}")[:4], "manifest.json") is bz2_codec
+    assert codecs.detect_codec(b"\x1f\x8b\x08\x00", "manifest.json").name == "gzip"
+    assert codecs.detect_codec(b"\x1b\x8f\x02\x00", "manifest.json.br").name == "brotli"
+    assert codecs.detect_codec(b'{"me', "manifest.json.br") is None
+    assert codecs.detect_codec(b'{"me', "manifest.json") is None
+
+    manifest = {"metadata": {}, "nodes": {}}
+    payload = ManifestPayload(
+        content=bz2.compress(json.dumps(manifest).encode("utf-8")), name="manifest"
+    )
+    assert decode_manifest(payload) == manifest
+
+
+def test_decompressing_reader_reads_in_chunks(monkeypatch):
+    """Confirm that chunk-based decompressors, like brotli's, can be read incrementally."""
+    monkeypatch.setattr(codecs, "CHUNK_SIZE", 64)
+
+    content = json.dumps({"nodes": list(range(1000))}).encode("utf-8")
+    compressed = zlib.compress(content)
+
+    reader = codecs.DecompressingReader(
+        io.BytesIO(compressed), zlib.decompressobj().decompress
+    )
+    chunks = list(iter(lambda: reader.read(100), b""))
+    assert b"".join(chunks) == content
+    assert max(len(chunk) for chunk in chunks) <= 100
+
+    reader = codecs.DecompressingReader(
+        io.BytesIO(compressed), zlib.decompressobj().decompress
+    )
+    assert reader.read() == content
+
+
+def test_decode_manifest_falls_back_to_stdlib_json(monkeypatch):
+    """Confirm that manifests rejected by a faster JSON backend are parsed by the standard library."""
+
+    class StrictDecodeError(ValueError):
+        pass
+
+    def strict_loads(content: bytes) -> Dict:
+        assert isinstance(content, bytes)
+        if b"NaN" in content:
+            raise StrictDecodeError("NaN is not valid JSON.")
+        if b"broken" in content:
+            raise RuntimeError("The decoder failed.")
+        return json.loads(content)
+
+    monkeypatch.setitem(
+        payload.JSON_BACKENDS,
+        "strict",
+        payload.JsonBackend(strict_loads, StrictDecodeError),
+    )
+
+    def decode(content: bytes) -> Dict:
+        return decode_manifest(
+            ManifestPayload(content=content, name="manifest"), json_backend="strict"
+        )
+
+    manifest = {"metadata": {"project_name": "revenue"}, "nodes": {}}
+    assert decode(json.dumps(manifest).encode("utf-8")) == manifest
+
+    output = decode(b'{"metadata": {"score": NaN}, "nodes": {}}')
+    assert output["nodes"] == {}
+    assert output["metadata"]["score"] != output["metadata"]["score"]
+
+    # Only decode errors fall back, so other failures are not hidden by a re-parse.
+    with pytest.raises(RuntimeError):
+        decode(b'{"metadata": {"state": "broken"}, "nodes": {}}')
+
+
+@pytest.fixture
+def flaky_server() -> Generator[Tuple[str, List[str]], None, None]:
+    """Serve a manifest over HTTP that fails with a 503 on the first request."""
+    manifest = json.dumps({"foo": "bar"}).encode("utf-8")
+    requests_seen: List[str] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests_seen.append(self.path)
+            if len(requests_seen) == 1:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(manifest)))
+            self.end_headers()
+            self.wfile.write(manifest)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_load_from_http_retries_transient_errors(flaky_server):
+    """Confirm that HTTP references are retried on transient errors using a shared session."""
+    url, requests_seen = flaky_server
+
+    session = create_session(backoff_factor=0)
+    manifest_loader = ManifestLoader(session=session)
+    manifest_reference = ManifestReference(
+        name="example",
+        type=ManifestReferenceType.file,
+        config=FileReferenceConfig(path=urlparse(f"{url}/manifest.json")),
+    )
+
+    assert manifest_loader.load(manifest_reference) == {"foo": "bar"}
+    assert requests_seen == ["/manifest.json", "/manifest.json"]
+    assert session.timeout == (10, 60)
+
+
+def test_load_from_http_raises_after_retries(flaky_server):
+    """Confirm that transient errors are raised once retries have been exhausted."""
+    url, requests_seen = flaky_server
+
+    with pytest.raises(requests.HTTPError):
+        ManifestLoader.load_from_http(
+            FileReferenceConfig(path=urlparse(f"{url}/manifest.json")),
+            session=create_session(retries=0),
+        )
+
+    assert requests_seen == ["/manifest.json"]
+
+
+class FakeS3Client:
+    """A fake S3 client that serves manifests from memory."""
+
+    class exceptions:
+        NoSuchBucket = type("NoSuchBucket", (Exception,), {})
+        NoSuchKey = type("NoSuchKey", (Exception,), {})
+        ClientError = type("ClientError", (Exception,), {})
+
+    def __init__(self, objects: Dict[str, bytes]) -> None:
+        self.objects = objects
+        self.closed = False
+
+    def get_object(self, Bucket: str, Key: str) -> Dict:
+        return {"Body": io.BytesIO(self.objects[Key]), "ETag": '"v1"'}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_object_store_clients_are_shared_across_references(monkeypatch):
+    """Confirm that references to the same object store share a single client."""
+    objects = {
+        f"{name}/manifest.json": json.dumps(
+            {"metadata": {"project_name": name}}
+        ).encode("utf-8")
+        for name in ("revenue", "marketing")
+    }
+    created: List[FakeS3Client] = []
+
+    def create_client():
+        created.append(FakeS3Client(objects))
+        return created[-1]
+
+    monkeypatch.setattr(S3Client, "_create_client", staticmethod(create_client))
+
+    manifest_loader = ManifestLoader()
+    for name in ("revenue", "marketing"):
+        manifest_reference = ManifestReference(
+            name=name,
+            type=ManifestReferenceType.s3,
+            config=S3ReferenceConfig(
+                bucket_name="example", object_name=f"{name}/manifest.json"
+            ),
+        )
+        manifest = manifest_loader.load(manifest_reference)
+        assert manifest == {"metadata": {"project_name": name}}
+
+    assert len(created) == 1
+
+    manifest_loader.close()
+    assert created[0].closed
+    assert manifest_loader.clients.get(("s3",), create_client) is not created[0]
+
+
+class FakeBlob:
+    """A fake GCS blob that serves ranged downloads and honors generation conditions."""
+
+    def __init__(
+        self, content: bytes, generation: int, content_encoding: Optional[str] = None
+    ) -> None:
+        self.content = content
+        self.current_generation = generation
+        self.current_content_encoding = content_encoding
+        self.generation = None
+        self.content_encoding = None
+        self.requests: List[Tuple[Optional[int], Optional[int]]] = []
+
+    def download_as_bytes(self, start=None, end=None, if_generation_not_match=None):
+        from google.api_core.exceptions import (
+            NotModified,
+            RequestRangeNotSatisfiable,
+        )
+
+        self.requests.append((start, end))
+        if if_generation_not_match == self.current_generation:
+            raise NotModified("Not modified.")
+
+        self.generation = self.current_generation
+        self.content_encoding = self.current_content_encoding
+
+        # Transcoded objects are always served in full, ignoring the range.
+        if start is None or self.content_encoding == "gzip":
+            return self.content
+        if start >= len(self.content):
+            raise RequestRangeNotSatisfiable("Range not satisfiable.")
+
+        return self.content[start : end + 1]
+
+
+class FakeGCSClient:
+    def __init__(self, blob: FakeBlob) -> None:
+        self._blob = blob
+
+    def bucket(self, bucket_name):
+        return self
+
+    def blob(self, object_name, generation=None):
+        return self._blob
+
+
+@pytest.mark.parametrize("size", [100, 256, 1000])
+def test_gcs_fetch_downloads_objects_directly(monkeypatch, size):
+    """Confirm that GCS objects are downloaded without metadata requests, and revalidated by generation."""
+    pytest.importorskip("google.api_core")
+    monkeypatch.setattr(gcs, "CHUNK_SIZE", 128)
+
+    manifest = {"metadata": {"project_name": "revenue"}, "nodes": {}}
+    content = json.dumps(manifest).encode("utf-8").ljust(size)
+    blob = FakeBlob(content, generation=7)
+    monkeypatch.setattr(
+        gcs.GCSClient, "_create_client", lambda self: FakeGCSClient(blob)
+    )
+
+    client = gcs.GCSClient(
+        project_id="example", bucket_name="example", object_name="manifest.json"
+    )
+    payload = client.fetch()
+    assert payload is not None
+    assert payload.version == "7"
+    assert decode_manifest(payload) == manifest
+    assert blob.requests[0] == (0, 127)
+    assert len(blob.requests) == size // 128 + 1
+
+    blob.requests = []
+    assert client.fetch(version="7") is None
+    assert len(blob.requests) == 1
+
+    # Pinned generations are never revalidated.
+    client.generation = 7
+    blob.requests = []
+    assert client.fetch(version="7") is None
+    assert blob.requests == []
+
+
+def test_gcs_fetch_downloads_transcoded_objects_in_full(monkeypatch):
+    """Confirm that objects stored with gzip content encoding are downloaded once, in full."""
+    pytest.importorskip("google.api_core")
+    monkeypatch.setattr(gcs, "CHUNK_SIZE", 128)
+
+    manifest = {"metadata": {"project_name": "revenue"}, "nodes": {}}
+    content = json.dumps(manifest).encode("utf-8").ljust(1000)
+    blob = FakeBlob(content, generation=7, content_encoding="gzip")
+    monkeypatch.setattr(
+        gcs.GCSClient, "_create_client", lambda self: FakeGCSClient(blob)
+    )
+
+    client = gcs.GCSClient(
+        project_id="example", bucket_name="example", object_name="manifest.json"
+    )
+    payload = client.fetch()
+    assert payload is not None
+    assert payload.version == "7"
+    assert decode_manifest(payload) == manifest
+    assert len(blob.requests) == 1
+
+
+class FakeSnowflakeConnections:
+    """Fake dbt connection manager that serves files from an in-memory stage."""
+
+    def __init__(self, files: Dict[str, bytes]) -> None:
+        self.files = files
+        self.queries: List[str] = []
+
+    def set_connection_name(self, name):
+        pass
+
+    def execute(self, query: str, fetch: bool = False):
+        self.queries.append(query)
+        if query.startswith("get "):
+            _, location, target = query.split(" ")
+            file_name = location.split("/")[-1]
+            Path(target[len("file://") :], file_name).write_bytes(
+                self.files[location[1:]]
+            )
+            return SimpleNamespace(rows_affected=1), None
+
+        if query.startswith("list "):
+            prefix = query.split(" ")[1][1:]
+            rows = [
+                {
+                    "name": path,
+                    "md5": hashlib.md5(content).hexdigest(),
+                    "last_modified": "Tue, 1 Oct 2024 00:00:00 GMT",
+                }
+                for path, content in self.files.items()
+                if path.startswith(prefix)
+            ]
+            return SimpleNamespace(rows_affected=len(rows)), SimpleNamespace(rows=rows)
+
+        urls = [f"https://example.com/{index}" for index in range(query.count("@"))]
+        return SimpleNamespace(rows_affected=1), SimpleNamespace(rows=[urls])
+
+
+def test_snowflake_references_share_a_connection(monkeypatch):
+    """Confirm that Snowflake references share a connection and clean up downloads."""
+    from dbt_loom.clients import snowflake_stage
+
+    manifest = {"metadata": {"project_name": "revenue"}, "nodes": {}}
+    connections = FakeSnowflakeConnections(
+        {
+            f"stage/{name}/manifest.json": json.dumps(manifest).encode("utf-8")
+            for name in ("revenue", "marketing")
+        }
+    )
+    connection = snowflake_stage.SnowflakeConnection.__new__(
+        snowflake_stage.SnowflakeConnection
+    )
+    connection.__dict__.update(
+        adapter=SimpleNamespace(connections=connections),
+        presigned_urls={},
+        _lock=threading.Lock(),
+    )
+    created_directories: List[str] = []
+    mkdtemp = snowflake_stage.tempfile.mkdtemp
+
+    def tracked_mkdtemp(*args, **kwargs):
+        created_directories.append(mkdtemp(*args, **kwargs))
+        return created_directories[-1]
+
+    monkeypatch.setattr(snowflake_stage.tempfile, "mkdtemp", tracked_mkdtemp)
+
+    manifest_loader = ManifestLoader()
+    manifest_loader.clients.get(("snowflake",), lambda: connection)
+    references = [
+        ManifestReference(
+            name=name,
+            type=ManifestReferenceType.snowflake,
+            config=snowflake_stage.SnowflakeReferenceConfig(
+                stage="stage", stage_path=f"{name}/manifest.json"
+            ),
+        )
+        for name in ("revenue", "marketing")
+    ]
+
+    for reference in references:
+        assert manifest_loader.load(reference) == manifest
+
+    # Manifests that are not cached are downloaded without listing the stage.
+    assert len(connections.queries) == 2
+    assert not any(query.startswith("list ") for query in connections.queries)
+    assert len(created_directories) == 2
+    assert not any(Path(directory).exists() for directory in created_directories)
+
+    # Unchanged files are revalidated by their MD5 digest, without downloading them.
+    client = snowflake_stage.SnowflakeClient(
+        stage="stage",
+        stage_path="revenue/manifest.json",
+        registry=manifest_loader.clients,
+    )
+    version = hashlib.md5(connections.files["stage/revenue/manifest.json"]).hexdigest()
+    assert client.fetch(version=version) is None
+    assert connections.queries[-1].startswith("list ")
+    assert len(created_directories) == 2
+
+    # Newly downloaded files are versioned after the download, for the cache.
+    payload = client.fetch()
+    assert payload is not None
+    assert payload.version == version
+    assert connections.queries[-2].startswith("get ")
+    assert connections.queries[-1].startswith("list ")
+    payload.stream.close()  # type: ignore
+    assert len(connections.queries) == 5
+
+    # Presigned URLs for every reference are generated with a single query.
+    for reference in references:
+        reference.config.presigned_url = True  # type: ignore
+    manifest_loader.prepare(references)
+    assert connections.queries[-1].count("get_presigned_url") == 2
+    assert connection.presigned_url("stage", "marketing/manifest.json") == (
+        "https://example.com/1"
+    )
+    assert len(connections.queries) == 6
+
+
+def test_databricks_references_share_a_workspace_client(monkeypatch):
+    """Confirm that Databricks references share a client, and download workspace files directly."""
+    import types
+
+    manifest = {"metadata": {"project_name": "revenue"}, "nodes": {}}
+    content = json.dumps(manifest).encode("utf-8")
+    clients: List[object] = []
+
+    downloads: List[str] = []
+
+    class FakeWorkspace:
+        def get_status(self, path):
+            return SimpleNamespace(modified_at=1700000000000)
+
+        def download(self, path, format=None):
+            downloads.append(path)
+            return io.BytesIO(content)
+
+        def export(self, path, format=None):
+            raise AssertionError("Workspace files should not be exported.")
+
+    class FakeWorkspaceClient:
+        def __init__(self) -> None:
+            clients.append(self)
+            self.workspace = FakeWorkspace()
+
+    sdk = types.ModuleType("databricks.sdk")
+    sdk.WorkspaceClient = FakeWorkspaceClient  # type: ignore
+    workspace = types.ModuleType("databricks.sdk.service.workspace")
+    workspace.ExportFormat = SimpleNamespace(AUTO="AUTO")  # type: ignore
+    monkeypatch.setitem(sys.modules, "databricks", types.ModuleType("databricks"))
+    monkeypatch.setitem(sys.modules, "databricks.sdk", sdk)
+    monkeypatch.setitem(
+        sys.modules,
+        "databricks.sdk.service",
+        types.ModuleType("databricks.sdk.service"),
+    )
+    monkeypatch.setitem(sys.modules, "databricks.sdk.service.workspace", workspace)
+
+    manifest_loader = ManifestLoader()
+    for name in ("revenue", "marketing"):
+        manifest_reference = ManifestReference(
+            name=name,
+            type=ManifestReferenceType.databricks,
+            config=DatabricksReferenceConfig(
+                path=f"/Workspace/Shared/{name}/manifest.json"
+            ),
+        )
+        assert manifest_loader.load(manifest_reference) == manifest
+
+    assert len(clients) == 1
+    assert len(downloads) == 2
+
+    # Unchanged files are revalidated by their modification time.
+    payload = manifest_loader.fetching_functions[ManifestReferenceType.databricks](
+        manifest_reference.config
+    )
+    assert payload is not None and payload.version == "1700000000000"
+    payload.close()
+    assert (
+        manifest_loader.fetching_functions[ManifestReferenceType.databricks](
+            manifest_reference.config, version="1700000000000"
+        )
+        is None
+    )
+    assert len(downloads) == 3
@@ -0,0 +1,90 @@
+from typing import Dict
+
+import pytest
+from pydantic import ValidationError
+
+from dbt_loom import identify_node_subgraph
+from dbt_loom.config import (
+    FileReferenceConfig,
+    ManifestReference,
+    ManifestReferenceType,
+)
+from dbt_loom.filters import NodeFilter
+
+
+@pytest.fixture
+def manifest() -> Dict:
+    def node(resource_type, package_name, name, fqn, access=None, tags=()):
+        return {
+            "unique_id": f"{resource_type}.{package_name}.{name}",
+            "name": name,
+            "package_name": package_name,
+            "resource_type": resource_type,
+            "schema": "main",
+            "fqn": fqn,
+            "tags": list(tags),
+            "config": {"access": access} if access else {},
+        }
+
+    nodes = [
+        node("model", "revenue", "orders", ["revenue", "marts", "orders"], "public"),
+        node(
+            "model",
+            "revenue",
+            "stg_orders",
+            ["revenue", "staging", "stg_orders"],
+            tags=["nightly"],
+        ),
+        node(
+            "model", "revenue", "accounts", ["revenue", "marts", "accounts"], "private"
+        ),
+        node("seed", "revenue", "integers", ["revenue", "integers"]),
+        node("model", "evaluator", "fct_issues", ["evaluator", "fct_issues"], "public"),
+    ]
+
+    return {"nodes": {node["unique_id"]: node for node in nodes}}
+
+
+@pytest.mark.parametrize(
+    "node_filter,expected",
+    [
+        (
+            NodeFilter(excluded_packages=["evaluator"]),
+            {
+                "model.revenue.orders",
+                "model.revenue.stg_orders",
+                "model.revenue.accounts",
+                "seed.revenue.integers",
+            },
+        ),
+        (
+            NodeFilter(resource_types=["model"], access=["public", "protected"]),
+            {
+                "model.revenue.orders",
+                "model.revenue.stg_orders",
+                "model.evaluator.fct_issues",
+            },
+        ),
+        (
+            NodeFilter(select=["revenue.marts", "tag:nightly"], exclude=["*.accounts"]),
+            {"model.revenue.orders", "model.revenue.stg_orders"},
+        ),
+    ],
+)
+def test_node_filters(manifest, node_filter, expected):
+    """Confirm that raw nodes are filtered before ManifestNodes are constructed."""
+
+    assert set(identify_node_subgraph(manifest, node_filter=node_filter)) == expected
+
+
+@pytest.mark.parametrize("field", ["select", "exclude"])
+def test_manifest_reference_rejects_unknown_selector_methods(field):
+    """Confirm that unsupported selector methods are rejected when the config is loaded."""
+
+    with pytest.raises(ValidationError, match="path:models/marts"):
+        ManifestReference(
+            name="revenue",
+            type=ManifestReferenceType.file,
+            config=FileReferenceConfig(path="manifest.json"),
+            **{field: ["tag:finance", "path:models/marts"]},
+        )